@@ -11,30 +11,54 @@ hashing when files haven't been touched since the last run.
 
 from __future__ import annotations
 
-import glob
+import fnmatch
 import hashlib
 import json
 import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from platformdirs import user_cache_dir
 
 if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
     from typing import Any
 
+    _Listing = Callable[[str], list[tuple[str, bool]]]
+
+_CHUNK_SIZE = 1024 * 1024
+_MAX_HASH_WORKERS = 8
+
+_DIGEST_CACHE: dict[tuple[str, int, int], str] = {}
+
 
 def _cache_root() -> Path:
     """Return the platform-appropriate root cache directory for conda-tasks."""
     return Path(user_cache_dir("conda-tasks"))
 
 
+def _project_key(project_root: Path) -> str:
+    """Return the short, stable cache key for *project_root*.
+
+    Relative roots are made absolute against the current directory
+    first, so the memo never outlives a ``chdir``.
+    """
+    return _absolute_project_key(project_root.absolute())
+
+
+@lru_cache(maxsize=32)
+def _absolute_project_key(project_root: Path) -> str:
+    """Hash the resolved form of the absolute path *project_root*."""
+    return hashlib.sha256(str(project_root.resolve()).encode()).hexdigest()[:16]
+
+
 def _project_cache_dir(project_root: Path) -> Path:
-    """Return the per-project cache directory, creating it if necessary."""
-    key = hashlib.sha256(str(project_root.resolve()).encode()).hexdigest()[:16]
-    d = _cache_root() / key
-    d.mkdir(parents=True, exist_ok=True)
-    return d
+    """Return the per-project cache directory (created by ``save_cache``)."""
+    return _cache_root() / _project_key(project_root)
 
 
 def _cache_file(project_root: Path, task_name: str) -> Path:
@@ -42,65 +66,283 @@ def _cache_file(project_root: Path, task_name: str) -> Path:
     return _project_cache_dir(project_root) / f"{task_name}.json"
 
 
-def _file_stat(path: str) -> tuple[float, int] | None:
-    """Return ``(mtime, size)`` for *path*, or None if missing."""
+def _file_stat(path: str) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for *path*, or None if missing."""
     try:
         st = os.stat(path)
-        return (st.st_mtime, st.st_size)
+        return (st.st_mtime_ns, st.st_size)
     except OSError:
         return None
 
 
+def clear_fingerprint_cache() -> None:
+    """Forget all file digests memoized by this process."""
+    _DIGEST_CACHE.clear()
+
+
 def _file_sha256(path: str) -> str:
-    """Return the hex SHA-256 digest of the file at *path*."""
-    h = hashlib.sha256()
-    with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
+    """Return the hex SHA-256 digest of the file at *path*.
+
+    Digests are memoized per process on ``(path, mtime_ns, size)`` so
+    files shared between several tasks in one run are only read once.
+    """
+    st = os.stat(path)
+    return _digest_for_stat(path, st.st_mtime_ns, st.st_size)
+
+
+def _digest_for_stat(path: str, mtime_ns: int, size: int) -> str:
+    """Return the memoized digest of *path* given its already-known stat."""
+    key = (os.path.abspath(path), mtime_ns, size)
+    digest = _DIGEST_CACHE.get(key)
+    if digest is None:
+        digest = _DIGEST_CACHE[key] = _sha256_digest(path)
+    return digest
+
+
+def _sha256_digest(path: str) -> str:
+    """Hash the contents of the file at *path* with SHA-256.
+
+    On Python 3.11+ this uses ``hashlib.file_digest``, which runs the
+    read/update loop in C and releases the GIL while hashing.
+    """
+    with open(path, "rb", buffering=0) as f:
+        if sys.version_info >= (3, 11):
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
             h.update(chunk)
-    return h.hexdigest()
+        return h.hexdigest()
+
+
+def _has_magic(segment: str) -> bool:
+    """Return True if *segment* contains glob wildcard characters."""
+    return "*" in segment or "?" in segment or "[" in segment
+
+
+@lru_cache(maxsize=256)
+def _compile_segment(segment: str) -> re.Pattern[str]:
+    """Compile a single path segment pattern (cached across calls)."""
+    return re.compile(fnmatch.translate(os.path.normcase(segment)))
+
+
+def _walk_visible(base: str, listdir: _Listing) -> Iterator[str]:
+    """Yield every non-hidden file and directory below *base*."""
+    for name, is_dir in listdir(base):
+        if name.startswith("."):
+            continue
+        path = os.path.join(base, name)
+        yield path
+        if is_dir:
+            yield from _walk_visible(path, listdir)
+
+
+def _match_segments(
+    base: str, parts: tuple[str, ...], listdir: _Listing
+) -> Iterator[str]:
+    """Yield paths under *base* matching the split pattern *parts*.
+
+    Mirrors ``glob.glob(..., recursive=True)``: wildcards don't match
+    names starting with ``.`` unless the segment itself does, and a
+    bare ``**`` matches zero or more non-hidden directories.
+    """
+    if not parts:
+        yield base
+        return
+    head, rest = parts[0], parts[1:]
+
+    if head == "**":
+        if not rest:
+            if not os.path.isdir(base):
+                return
+            yield os.path.join(base, "")
+            yield from _walk_visible(base, listdir)
+            return
+        yield from _match_segments(base, rest, listdir)
+        for name, is_dir in listdir(base):
+            if is_dir and not name.startswith("."):
+                yield from _match_segments(os.path.join(base, name), parts, listdir)
+        return
+
+    if not _has_magic(head):
+        path = os.path.join(base, head)
+        if rest:
+            yield from _match_segments(path, rest, listdir)
+        elif os.path.lexists(path):
+            yield path
+        return
+
+    regex = _compile_segment(head)
+    include_hidden = head.startswith(".")
+    for name, is_dir in listdir(base):
+        if rest and not is_dir:
+            continue
+        if name.startswith(".") and not include_hidden:
+            continue
+        if regex.match(os.path.normcase(name)):
+            path = os.path.join(base, name)
+            if rest:
+                yield from _match_segments(path, rest, listdir)
+            else:
+                yield path
 
 
 def _expand_globs(patterns: list[str], cwd: Path) -> list[str]:
-    """Expand glob patterns relative to *cwd*, return sorted paths."""
-    result: set[str] = set()
+    """Expand glob patterns relative to *cwd*, return sorted paths.
+
+    Each directory is listed at most once per call with ``os.scandir``,
+    so overlapping patterns (e.g. several ``**`` globs) share the work.
+    """
+    listings: dict[str, list[tuple[str, bool]]] = {}
+
+    def listdir(directory: str) -> list[tuple[str, bool]]:
+        entries = listings.get(directory)
+        if entries is None:
+            entries = []
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        entries.append((entry.name, is_dir))
+            except OSError:
+                pass
+            listings[directory] = entries
+        return entries
+
+    matches: list[str] = []
     for pattern in patterns:
-        expanded = glob.glob(str(cwd / pattern), recursive=True)
-        result.update(expanded)
-    return sorted(result)
+        rel = Path(pattern)
+        if rel.is_absolute():
+            base, parts = rel.anchor, rel.parts[1:]
+        else:
+            base, parts = str(cwd), rel.parts
+        matches.extend(_match_segments(base, parts, listdir))
+    if len(matches) <= 1:
+        return matches
+    matches.sort()
+    return [p for i, p in enumerate(matches) if i == 0 or p != matches[i - 1]]
+
+
+def _hash_files(files: list[tuple[str, int, int]]) -> list[str]:
+    """Return the SHA-256 digest of each ``(path, mtime_ns, size)``, in order.
+
+    The stat is the one the caller already took, so files are not
+    stat'ed again before hashing. Files are hashed on a thread pool when
+    there is more than one, since hashing releases the GIL and the work
+    is mostly I/O bound.
+    """
+    if len(files) <= 1:
+        return [_digest_for_stat(*f) for f in files]
+    with ThreadPoolExecutor(max_workers=min(_MAX_HASH_WORKERS, len(files))) as ex:
+        return list(ex.map(_digest_for_stat, *zip(*files)))
 
 
-def _fingerprint_files(paths: list[str]) -> dict[str, dict[str, Any]]:
-    """Build a fingerprint dict: ``{path: {mtime, size, sha256}}``."""
-    fp: dict[str, dict[str, Any]] = {}
+def _stat_files(paths: list[str]) -> dict[str, tuple[int, int]]:
+    """Return ``{path: (mtime_ns, size)}`` for the paths that can be stat'ed.
+
+    Missing files and dangling symlinks are omitted, matching what
+    ``_fingerprint_files`` records.
+    """
+    stats: dict[str, tuple[int, int]] = {}
     for p in paths:
         stat = _file_stat(p)
-        if stat is None:
-            continue
-        fp[p] = {
-            "mtime": stat[0],
-            "size": stat[1],
-            "sha256": _file_sha256(p),
-        }
+        if stat is not None:
+            stats[p] = stat
+    return stats
+
+
+def _fingerprint_files(
+    paths: list[str],
+    previous: dict[str, Any] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Build a fingerprint dict: ``{path: {mtime_ns, size, sha256}}``.
+
+    When *previous* fingerprints are given, files whose ``(mtime, size)``
+    is unchanged reuse the recorded digest instead of being re-hashed.
+    Missing files are omitted.
+    """
+    return _fingerprint_stats(_stat_files(paths), previous)
+
+
+def _fingerprint_stats(
+    stats: dict[str, tuple[int, int]],
+    previous: dict[str, Any] | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Like ``_fingerprint_files``, for paths already stat'ed by ``_stat_files``."""
+    previous = previous or {}
+    fp: dict[str, dict[str, Any]] = {}
+    to_hash: list[tuple[str, int, int]] = []
+    for p, stat in stats.items():
+        entry: dict[str, Any] = {"mtime_ns": stat[0], "size": stat[1]}
+        prev = previous.get(p)
+        if (
+            prev is not None
+            and prev.get("mtime_ns") == entry["mtime_ns"]
+            and prev.get("size") == entry["size"]
+            and "sha256" in prev
+        ):
+            entry["sha256"] = prev["sha256"]
+        else:
+            to_hash.append((p, *stat))
+        fp[p] = entry
+    for (p, _, _), digest in zip(to_hash, _hash_files(to_hash)):
+        fp[p]["sha256"] = digest
     return fp
 
 
+@lru_cache(maxsize=128)
+def _cmd_hash(cmd: str) -> str:
+    """Return the hex digest identifying *cmd*."""
+    return hashlib.sha256(cmd.encode()).hexdigest()
+
+
+def _env_hash(env: dict[str, str]) -> str:
+    """Return the hex digest identifying *env*."""
+    return _env_items_hash(tuple(sorted(env.items())))
+
+
+@lru_cache(maxsize=128)
+def _env_items_hash(items: tuple[tuple[str, str], ...]) -> str:
+    """Hash sorted env *items* (memoised, so repeat checks are free)."""
+    return hashlib.sha256(json.dumps(dict(items), sort_keys=True).encode()).hexdigest()
+
+
 def _compute_entry(
     cmd: str,
     env: dict[str, str],
     input_files: list[str],
     output_files: list[str],
+    previous: dict[str, Any] | None = None,
 ) -> dict[str, Any]:
-    """Compute a cache entry from current state."""
-    cmd_hash = hashlib.sha256(cmd.encode()).hexdigest()
-    env_hash = hashlib.sha256(json.dumps(env, sort_keys=True).encode()).hexdigest()
+    """Compute a cache entry from current state.
+
+    Digests from a *previous* entry are reused for files whose
+    ``(mtime, size)`` has not changed.
+    """
+    previous = previous or {}
     return {
-        "cmd_hash": cmd_hash,
-        "env_hash": env_hash,
-        "inputs": _fingerprint_files(input_files),
-        "outputs": _fingerprint_files(output_files),
+        "cmd_hash": _cmd_hash(cmd),
+        "env_hash": _env_hash(env),
+        "inputs": _fingerprint_files(input_files, previous.get("inputs")),
+        "outputs": _fingerprint_files(output_files, previous.get("outputs")),
     }
 
 
+def load_cache(project_root: Path, task_name: str) -> dict[str, Any] | None:
+    """Return the stored cache entry for a task, or None if missing or corrupt.
+
+    The result can be handed to ``is_cached`` and ``save_cache`` as
+    *entry* so the file is only read once per task run.
+    """
+    try:
+        data = json.loads(_cache_file(project_root, task_name).read_bytes())
+    except (ValueError, OSError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
 def is_cached(
     project_root: Path,
     task_name: str,
@@ -109,6 +351,8 @@ def is_cached(
     input_patterns: list[str],
     output_patterns: list[str],
     cwd: Path,
+    *,
+    entry: dict[str, Any] | None = None,
 ) -> bool:
     """Check whether the task can be skipped (cache hit).
 
@@ -119,30 +363,29 @@ def is_cached(
     3. All input files match by ``(mtime, size)`` -- falling back to
        SHA-256 if the fast check fails.
     4. All output files still exist and match.
-    """
-    cf = _cache_file(project_root, task_name)
-    if not cf.exists():
-        return False
 
-    try:
-        cached = json.loads(cf.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
+    Only files whose ``(mtime, size)`` changed since the cached run are
+    hashed. *entry* is an entry already returned by ``load_cache``; when
+    omitted it is read from disk.
+    """
+    cached = entry if entry is not None else load_cache(project_root, task_name)
+    if cached is None:
         return False
 
-    input_files = _expand_globs(input_patterns, cwd)
-    output_files = _expand_globs(output_patterns, cwd)
-
-    current = _compute_entry(cmd, env, input_files, output_files)
-
-    if cached.get("cmd_hash") != current["cmd_hash"]:
+    if cached.get("cmd_hash") != _cmd_hash(cmd):
         return False
-    if cached.get("env_hash") != current["env_hash"]:
+    if cached.get("env_hash") != _env_hash(env):
         return False
 
-    if not _files_match(cached.get("inputs", {}), current["inputs"]):
-        return False
-    if not _files_match(cached.get("outputs", {}), current["outputs"]):
-        return False
+    for key, patterns in (("inputs", input_patterns), ("outputs", output_patterns)):
+        previous = cached.get(key, {})
+        # Compare the set of files that can be fingerprinted, not the raw
+        # glob matches, which also include dangling symlinks.
+        stats = _stat_files(_expand_globs(patterns, cwd))
+        if stats.keys() != previous.keys():
+            return False
+        if not _files_match(previous, _fingerprint_stats(stats, previous)):
+            return False
 
     return True
 
@@ -150,15 +393,17 @@ def is_cached(
 def _files_match(cached: dict[str, Any], current: dict[str, Any]) -> bool:
     """Compare two fingerprint dicts.
 
-    Fast path: if ``(mtime, size)`` match, skip SHA-256 comparison.
+    Fast path: if ``(mtime_ns, size)`` match, skip SHA-256 comparison.
+    Entries written before ``mtime_ns`` was recorded always take the
+    SHA-256 path.
     """
-    if set(cached.keys()) != set(current.keys()):
+    if len(cached) != len(current):
         return False
     for path, cur in current.items():
         prev = cached.get(path)
         if prev is None:
             return False
-        if prev["mtime"] == cur["mtime"] and prev["size"] == cur["size"]:
+        if prev.get("mtime_ns") == cur["mtime_ns"] and prev["size"] == cur["size"]:
             continue
         if prev["sha256"] != cur["sha256"]:
             return False
@@ -173,10 +418,37 @@ def save_cache(
     input_patterns: list[str],
     output_patterns: list[str],
     cwd: Path,
+    *,
+    entry: dict[str, Any] | None = None,
 ) -> None:
-    """Write or update the cache entry for a task."""
+    """Write or update the cache entry for a task.
+
+    Digests recorded by a previous run are reused for files whose
+    ``(mtime, size)`` has not changed, and nothing is written when the
+    new entry equals the stored one. *entry* is an entry already
+    returned by ``load_cache``; when omitted it is read from disk.
+    """
+    previous = entry if entry is not None else load_cache(project_root, task_name)
     input_files = _expand_globs(input_patterns, cwd)
     output_files = _expand_globs(output_patterns, cwd)
-    entry = _compute_entry(cmd, env, input_files, output_files)
+    current = _compute_entry(cmd, env, input_files, output_files, previous)
+    if current == previous:
+        return
     cf = _cache_file(project_root, task_name)
-    cf.write_text(json.dumps(entry, indent=2), encoding="utf-8")
+    cf.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(cf, json.dumps(current, separators=(",", ":")).encode())
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write *data* to *path* via a temporary file and ``os.replace``.
+
+    Readers never observe a partially written cache entry, even if the
+    process is interrupted mid-write.
+    """
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
@@ -12,6 +12,17 @@ from conda.cli.helpers import (
 )
 
 
+def _positive_int(value: str) -> int:
+    """argparse type for options that need an integer of at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value!r}")
+    return number
+
+
 def generate_parser() -> argparse.ArgumentParser:
     """Build and return the parser -- used by sphinxarg.ext for docs."""
     parser = argparse.ArgumentParser(
@@ -60,6 +71,13 @@ def configure_parser(parser: argparse.ArgumentParser) -> None:
         default=False,
         help="Skip dependency tasks, run only the named task.",
     )
+    run_parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        metavar="N",
+        help="Run up to N independent tasks at the same time (default: 1).",
+    )
     run_parser.add_argument(
         "--cwd",
         type=Path,
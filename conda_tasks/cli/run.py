@@ -7,9 +7,10 @@ from typing import TYPE_CHECKING
 
 from conda.base.context import context, locate_prefix_by_name
 
-from ..cache import is_cached, save_cache
+from ..cache import clear_fingerprint_cache, is_cached, load_cache, save_cache
+from ..context import clear_template_context
 from ..exceptions import CondaTasksError, TaskExecutionError
-from ..graph import resolve_execution_order
+from ..graph import resolve_execution_order, run_concurrently
 from ..parsers import detect_and_parse
 from ..runner import SubprocessShell
 from ..template import render, render_list
@@ -52,6 +53,8 @@ def _resolve_task_args(task: Task, cli_args: list[str]) -> dict[str, str]:
 
 def execute_run(args: argparse.Namespace) -> int:
     """Execute the ``conda task run`` subcommand."""
+    clear_fingerprint_cache()
+    clear_template_context()
     file_path = getattr(args, "file", None)
     task_file, tasks = detect_and_parse(file_path=file_path)
     project_root = task_file.parent
@@ -75,11 +78,11 @@ def execute_run(args: argparse.Namespace) -> int:
 
     shell = SubprocessShell()
 
-    for name in order:
+    def run_task(name: str) -> None:
         task = tasks[name]
 
         if task.is_alias:
-            continue
+            return
 
         if name == target_name:
             current_args = task_args
@@ -102,7 +105,7 @@ def execute_run(args: argparse.Namespace) -> int:
 
         cmd = task.cmd
         if cmd is None:
-            continue
+            return
         if isinstance(cmd, list):
             cmd = " ".join(cmd)
 
@@ -129,7 +132,9 @@ def execute_run(args: argparse.Namespace) -> int:
             task.outputs, manifest_path=task_file, task_args=current_args
         )
 
+        cache_entry = None
         if rendered_inputs or rendered_outputs:
+            cache_entry = load_cache(project_root, name)
             if is_cached(
                 project_root,
                 name,
@@ -138,14 +143,15 @@ def execute_run(args: argparse.Namespace) -> int:
                 rendered_inputs,
                 rendered_outputs,
                 cwd,
+                entry=cache_entry,
             ):
                 if not quiet:
                     print(f"  [cached] {name}")
-                continue
+                return
 
         if dry_run:
             print(f"  [dry-run] {name}: {cmd}")
-            continue
+            return
 
         if not quiet:
             print(f"  [run] {name}: {cmd}")
@@ -176,8 +182,16 @@ def execute_run(args: argparse.Namespace) -> int:
                 rendered_inputs,
                 rendered_outputs,
                 cwd,
+                entry=cache_entry,
             )
 
+    jobs = getattr(args, "jobs", 1)
+    if jobs > 1:
+        run_concurrently(order, tasks, run_task, jobs=jobs)
+    else:
+        for name in order:
+            run_task(name)
+
     if not quiet and tasks[target_name].is_alias:
         print(f"  [done] {target_name}")
 
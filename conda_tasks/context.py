@@ -7,48 +7,67 @@ mirror pixi's built-in template variables.
 from __future__ import annotations
 
 import os
+from functools import cached_property, lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+    from conda.base.context import Context
+
+
+@lru_cache(maxsize=1)
+def _conda_context() -> Context:
+    """Import conda's global context on first use and keep the reference."""
+    from conda.base.context import context
+
+    return context
+
+
+@lru_cache(maxsize=1)
+def _conda_constants() -> ModuleType:
+    """Import ``conda.base.constants`` on first use and keep the reference."""
+    from conda.base import constants
+
+    return constants
 
 
 class CondaContext:
     """Lazy-evaluated namespace exposed as ``conda.*`` in templates.
 
     Attribute access is deferred so we only import conda internals when
-    a template actually references a variable.
+    a template actually references a variable. Each value is computed at
+    most once per instance.
     """
 
     def __init__(self, manifest_path: Path | None = None):
         self._manifest_path = manifest_path
 
-    @property
+    @cached_property
     def platform(self) -> str:
         """The conda platform/subdir string, e.g. ``linux-64`` or ``osx-arm64``."""
-        from conda.base.context import context
+        return _conda_context().subdir
 
-        return context.subdir
-
-    @property
+    @cached_property
     def environment_name(self) -> str:
         """Name of the currently active conda environment, or ``"base"``."""
-        from conda.base.context import context
-
+        context = _conda_context()
         if context.active_prefix:
             return Path(context.active_prefix).name
         return "base"
 
-    @property
+    @cached_property
     def environment(self) -> _EnvironmentProxy:
         """Allows ``{{ conda.environment.name }}`` in templates."""
         return _EnvironmentProxy(self.environment_name)
 
-    @property
+    @cached_property
     def prefix(self) -> str:
         """Absolute path to the target conda environment prefix."""
-        from conda.base.context import context
-
-        return str(context.target_prefix)
+        return str(_conda_context().target_prefix)
 
-    @property
+    @cached_property
     def version(self) -> str:
         """The installed conda version string."""
         from conda import __version__
@@ -60,38 +79,30 @@ class CondaContext:
         """Path to the task definition file, or empty string if unknown."""
         return str(self._manifest_path) if self._manifest_path else ""
 
-    @property
+    @cached_property
     def init_cwd(self) -> str:
-        """The working directory at the time of context creation."""
+        """The working directory when first accessed (cached per instance)."""
         return os.getcwd()
 
-    @property
+    @cached_property
     def is_win(self) -> bool:
         """True when running on Windows."""
-        from conda.base.constants import on_win
-
-        return on_win
+        return _conda_constants().on_win
 
-    @property
+    @cached_property
     def is_unix(self) -> bool:
         """True when running on a Unix-like system (Linux or macOS)."""
-        from conda.base.constants import on_win
-
-        return not on_win
+        return not _conda_constants().on_win
 
-    @property
+    @cached_property
     def is_linux(self) -> bool:
         """True when the host platform is Linux."""
-        from conda.base.context import context
-
-        return context.platform == "linux"
+        return _conda_context().platform == "linux"
 
-    @property
+    @cached_property
     def is_osx(self) -> bool:
         """True when the host platform is macOS."""
-        from conda.base.context import context
-
-        return context.platform == "osx"
+        return _conda_context().platform == "osx"
 
 
 class _EnvironmentProxy:
@@ -101,6 +112,26 @@ class _EnvironmentProxy:
         self.name = name
 
 
+@lru_cache(maxsize=8)
+def _template_namespace(manifest_path: Path | None) -> CondaContext:
+    """Return the shared CondaContext for *manifest_path*.
+
+    Every command, env value, input and output of a run is rendered
+    against the same manifest, so the namespace (and the values it has
+    already looked up) is reused across renders.
+    """
+    return CondaContext(manifest_path=manifest_path)
+
+
+def clear_template_context() -> None:
+    """Forget the shared namespaces, so values are looked up again.
+
+    ``conda.init_cwd``, ``conda.prefix`` and friends are fixed once a
+    namespace has computed them; call this at the start of each run.
+    """
+    _template_namespace.cache_clear()
+
+
 def build_template_context(
     manifest_path: Path | None = None,
     task_args: dict[str, str] | None = None,
@@ -108,11 +139,11 @@ def build_template_context(
     """Build the full Jinja2 template context dict.
 
     The returned dict contains:
-    - ``conda``: a CondaContext instance
+    - ``conda``: the CondaContext shared by all renders for *manifest_path*
     - ``pixi``: alias to the same CondaContext (for pixi.toml compat)
     - Any user-supplied task argument values
     """
-    ctx = CondaContext(manifest_path=manifest_path)
+    ctx = _template_namespace(manifest_path)
     result: dict[str, object] = {"conda": ctx, "pixi": ctx}
     if task_args:
         result.update(task_args)
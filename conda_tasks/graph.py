@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import heapq
 from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from typing import TYPE_CHECKING
 
 from .exceptions import CyclicDependencyError, TaskNotFoundError
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Future
+
     from .models import Task
 
 
@@ -36,6 +41,68 @@ def resolve_execution_order(
     return _topological_sort(reachable, tasks)
 
 
+def run_concurrently(
+    order: list[str],
+    tasks: dict[str, Task],
+    run_task: Callable[[str], object],
+    *,
+    jobs: int,
+) -> None:
+    """Call *run_task* for every name in *order*, up to *jobs* at a time.
+
+    *order* is a result of ``resolve_execution_order``. A task starts
+    once all of its dependencies within *order* have finished. Among
+    ready tasks, the one heading the longest chain of dependents goes
+    first, so the critical path is never left waiting behind short
+    side branches; ties keep their position in *order*. After the
+    first failure no new tasks start, the running ones are waited for,
+    and the exception is re-raised.
+    """
+    names = set(order)
+    position = {name: i for i, name in enumerate(order)}
+    waiting_on: dict[str, set[str]] = {
+        name: {d.task for d in tasks[name].depends_on if d.task in names}
+        for name in order
+    }
+    dependents: dict[str, list[str]] = {name: [] for name in order}
+    for name, deps in waiting_on.items():
+        for dep in deps:
+            dependents[dep].append(name)
+
+    # Longest chain from each task to the end of the graph, inclusive.
+    chain: dict[str, int] = {}
+    for name in reversed(order):
+        chain[name] = 1 + max((chain[n] for n in dependents[name]), default=0)
+    priority = {name: (-chain[name], position[name]) for name in order}
+
+    ready = [priority[name] for name in order if not waiting_on[name]]
+    heapq.heapify(ready)
+    running: dict[Future[object], str] = {}
+    failure: BaseException | None = None
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while ready or running:
+            while ready and failure is None and len(running) < jobs:
+                name = order[heapq.heappop(ready)[1]]
+                running[pool.submit(run_task, name)] = name
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                exc = future.exception()
+                if exc is not None:
+                    failure = failure or exc
+                    continue
+                for successor in dependents[name]:
+                    waiting_on[successor].discard(name)
+                    if not waiting_on[successor]:
+                        heapq.heappush(ready, priority[successor])
+
+    if failure is not None:
+        raise failure
+
+
 def _collect_reachable(target: str, tasks: dict[str, Task]) -> set[str]:
     """BFS to gather all tasks reachable via depends-on from *target*."""
     visited: set[str] = set()
@@ -2,14 +2,32 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field, fields
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from typing import Any
 
-
-@dataclass
+_OVERRIDABLE_FIELDS: tuple[str, ...] = (
+    "cmd",
+    "args",
+    "depends_on",
+    "cwd",
+    "env",
+    "inputs",
+    "outputs",
+    "clean_env",
+)
+
+_PASSTHROUGH_FIELDS: tuple[str, ...] = (
+    "name",
+    "description",
+    "default_environment",
+    "platforms",
+)
+
+
+@dataclass(slots=True)
 class TaskArg:
     """A named argument that can be passed to a task."""
 
@@ -17,7 +35,7 @@ class TaskArg:
     default: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskDependency:
     """A reference to another task that must run first."""
 
@@ -26,7 +44,7 @@ class TaskDependency:
     environment: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskOverride:
     """Per-platform override for any task field.
 
@@ -44,7 +62,7 @@ class TaskOverride:
     clean_env: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """A single task definition with all its configuration."""
 
@@ -81,16 +99,8 @@ class Task:
             return self
 
         override = self.platforms[subdir]
-        kwargs: dict[str, Any] = {}
-        for f in fields(self):
-            if f.name in ("name", "platforms", "description", "default_environment"):
-                kwargs[f.name] = getattr(self, f.name)
-                continue
-            override_val = (
-                getattr(override, f.name, None) if hasattr(override, f.name) else None
-            )
-            if override_val is not None:
-                kwargs[f.name] = override_val
-            else:
-                kwargs[f.name] = getattr(self, f.name)
+        kwargs: dict[str, Any] = {f: getattr(self, f) for f in _PASSTHROUGH_FIELDS}
+        for f in _OVERRIDABLE_FIELDS:
+            value = getattr(override, f)
+            kwargs[f] = value if value is not None else getattr(self, f)
         return Task(**kwargs)
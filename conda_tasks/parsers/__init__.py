@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from functools import lru_cache
+import os
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from ..exceptions import NoTaskFileError, TaskParseError
 from .base import TaskFileParser
 from .condarc import CondaRCParser
+from .filecache import StampedCache, file_stamp
 from .pixi_toml import PixiTomlParser
 from .pyproject_toml import PyprojectTomlParser
 from .toml import CondaTomlParser
@@ -24,26 +25,71 @@ _SEARCH_ORDER: tuple[str, ...] = (
     "pyproject.toml",
     ".condarc",
 )
+_SEARCH_NAMES = frozenset(_SEARCH_ORDER)
 
+_PARSERS: tuple[TaskFileParser, ...] = (
+    PixiTomlParser(),
+    CondaTomlParser(),
+    PyprojectTomlParser(),
+    CondaRCParser(),
+)
+
+
+# Parsers that don't declare filenames are probed for every path.
+_GENERIC_PARSERS = tuple(p for p in _PARSERS if not p.filenames)
+
+
+def _index_by_filename(
+    parsers: tuple[TaskFileParser, ...],
+) -> dict[str, tuple[TaskFileParser, ...]]:
+    """Map each known filename to the parsers to probe, in priority order."""
+    index: dict[str, tuple[TaskFileParser, ...]] = {}
+    for parser in parsers:
+        for name in parser.filenames:
+            index[name] = index.get(name, ()) + (parser,)
+    return {name: claimed + _GENERIC_PARSERS for name, claimed in index.items()}
 
-def _parser_registry() -> list[TaskFileParser]:
-    """Return all registered parser instances in detection priority order."""
-    return [
-        PixiTomlParser(),
-        CondaTomlParser(),
-        PyprojectTomlParser(),
-        CondaRCParser(),
-    ]
+
+_PARSERS_BY_FILENAME = _index_by_filename(_PARSERS)
 
 
 def get_parser(path: Path) -> TaskFileParser | None:
-    """Return the first parser that can handle *path*, or ``None``."""
-    for parser in _parser_registry():
+    """Return the first parser that can handle *path*, or ``None``.
+
+    Candidates are looked up by filename, so only parsers that claim
+    ``path.name`` have their ``can_handle`` probed.
+    """
+    for parser in _PARSERS_BY_FILENAME.get(path.name, _GENERIC_PARSERS):
         if parser.can_handle(path):
             return parser
     return None
 
 
+def _task_files_in(directory: Path) -> set[str]:
+    """Return the known task file names present in *directory*.
+
+    Uses a single ``os.scandir`` instead of one ``stat`` per candidate.
+    Entries that only differ in case (``Conda.toml``) are confirmed with
+    a lookup under the canonical name, so they are found on
+    case-insensitive filesystems, just like a direct ``is_file`` check.
+    """
+    present: set[str] = set()
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name.lower()
+                if name not in _SEARCH_NAMES:
+                    continue
+                if entry.name == name:
+                    if entry.is_file():
+                        present.add(name)
+                elif (directory / name).is_file():
+                    present.add(name)
+    except OSError:
+        return set()
+    return present
+
+
 def detect_task_file(start_dir: Path | None = None) -> Path | None:
     """Walk up from *start_dir* looking for a known task file.
 
@@ -55,11 +101,11 @@ def detect_task_file(start_dir: Path | None = None) -> Path | None:
 
     current = start_dir
     while True:
+        present = _task_files_in(current)
         for name in _SEARCH_ORDER:
-            candidate = current / name
-            if candidate.is_file():
-                parser = get_parser(candidate)
-                if parser is not None:
+            if name in present:
+                candidate = current / name
+                if get_parser(candidate) is not None:
                     return candidate
         parent = current.parent
         if parent == current:
@@ -68,14 +114,33 @@ def detect_task_file(start_dir: Path | None = None) -> Path | None:
     return None
 
 
-@lru_cache(maxsize=4)
+_PARSE_CACHE: StampedCache[dict[str, Task]] = StampedCache(maxsize=4)
+
+
 def _cached_parse(path: str) -> dict[str, Task]:
-    """Parse a task file (cached by path string for memoisation)."""
+    """Parse a task file, memoised on its ``(mtime_ns, size)``.
+
+    Edits to the file between calls in the same process invalidate the
+    cached result.
+    """
+    try:
+        stamp = file_stamp(path)
+    except OSError:
+        stamp = None
+    else:
+        cached = _PARSE_CACHE.get(path, stamp)
+        if cached is not None:
+            return cached
+
     p = Path(path)
     parser = get_parser(p)
     if parser is None:
         raise TaskParseError(str(p), "no parser found for this file format")
-    return parser.parse(p)
+    tasks = parser.parse(p)
+
+    if stamp is not None:
+        _PARSE_CACHE.put(path, stamp, tasks)
+    return tasks
 
 
 def detect_and_parse(
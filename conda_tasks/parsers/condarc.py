@@ -19,6 +19,7 @@ from conda.common.serialize.yaml import loads as yaml_loads
 
 from ..exceptions import TaskNotFoundError, TaskParseError
 from .base import TaskFileParser
+from .filecache import StampedCache, file_stamp
 from .normalize import normalize_tasks
 
 if TYPE_CHECKING:
@@ -26,9 +27,36 @@ if TYPE_CHECKING:
     from typing import Any, ClassVar
 
     from ..models import Task
+    from .filecache import Stamp
 
 _CONDARC_KEY = "conda_tasks"
 
+_PARSED: StampedCache[dict[str, Any]] = StampedCache(maxsize=4)
+
+
+def _load_condarc(
+    path: Path,
+    stamp: Stamp | None = None,
+    text: str | None = None,
+) -> dict[str, Any]:
+    """Return the YAML mapping in *path*, memoised on its stamp.
+
+    ``can_handle`` and the ``parse`` fallback read the same file back to
+    back; this keeps that to a single YAML parse. *text* may be passed
+    when the file was already read, together with the *stamp* taken
+    before reading it, so a concurrent edit is never cached under the
+    newer stamp.
+    """
+    if stamp is None:
+        stamp = file_stamp(path)
+    data = _PARSED.get(str(path), stamp)
+    if data is None:
+        if text is None:
+            text = path.read_text(encoding="utf-8")
+        data = yaml_loads(text) or {}
+        _PARSED.put(str(path), stamp, data)
+    return data
+
 
 def _raw_tasks_from_condarc() -> dict[str, Any]:
     """Extract raw task definitions from all condarc sources via conda's config API.
@@ -66,8 +94,15 @@ class CondaRCParser(TaskFileParser):
         if path.name not in self.filenames:
             return False
         try:
-            data = yaml_loads(path.read_text(encoding="utf-8")) or {}
-        except YAMLError:
+            stamp = file_stamp(path)
+            text = path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return False
+        if "conda_tasks" not in text and "conda-tasks" not in text:
+            return False
+        try:
+            data = _load_condarc(path, stamp, text)
+        except (YAMLError, OSError):
             return False
         plugins = data.get("plugins", {})
         if not isinstance(plugins, dict):
@@ -80,7 +115,7 @@ class CondaRCParser(TaskFileParser):
         raw_tasks = _raw_tasks_from_condarc()
         if not raw_tasks:
             try:
-                data = yaml_loads(path.read_text(encoding="utf-8")) or {}
+                data = _load_condarc(path)
             except YAMLError as exc:
                 raise TaskParseError(str(path), str(exc)) from exc
             plugins = data.get("plugins", {})
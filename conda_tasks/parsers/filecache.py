@@ -0,0 +1,54 @@
+"""Small bounded caches for values derived from task files.
+
+Entries are keyed on the file path and stamped with the file's
+``(mtime_ns, size)``, so an edit to the file invalidates its entry.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+T = TypeVar("T")
+
+Stamp = tuple[int, int]
+
+
+def file_stamp(path: str | Path) -> Stamp:
+    """Return ``(mtime_ns, size)`` for *path*; raises ``OSError`` if missing."""
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
+class StampedCache(Generic[T]):
+    """Remember up to *maxsize* values, each tied to a file's stamp.
+
+    A lookup only hits when the stamp matches the one stored with the
+    value. Storing a new key when full evicts the oldest entry. Cached
+    values are shared, so callers must not mutate them.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: dict[str, tuple[Stamp, T]] = {}
+
+    def get(self, key: str, stamp: Stamp) -> T | None:
+        """Return the value stored for *key* under *stamp*, or None."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stamp:
+            return entry[1]
+        return None
+
+    def put(self, key: str, stamp: Stamp, value: T) -> None:
+        """Store *value* for *key* under *stamp*."""
+        self._entries.pop(key, None)
+        if len(self._entries) >= self._maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (stamp, value)
+
+    def clear(self) -> None:
+        """Forget every entry."""
+        self._entries.clear()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
 from ..models import Task, TaskArg, TaskDependency, TaskOverride
@@ -10,6 +11,11 @@ if TYPE_CHECKING:
     from typing import Any
 
 
+def _intern(value: Any) -> Any:
+    """Intern *value* if it is a string; malformed values pass through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def normalize_depends_on(raw: list[Any] | str | None) -> list[TaskDependency]:
     """Convert the various ``depends-on`` formats into TaskDependency objects.
 
@@ -21,15 +27,15 @@ def normalize_depends_on(raw: list[Any] | str | None) -> list[TaskDependency]:
     if raw is None:
         return []
     if isinstance(raw, str):
-        return [TaskDependency(task=raw)]
+        return [TaskDependency(task=_intern(raw))]
     result: list[TaskDependency] = []
     for item in raw:
         if isinstance(item, str):
-            result.append(TaskDependency(task=item))
+            result.append(TaskDependency(task=_intern(item)))
         elif isinstance(item, dict):
             result.append(
                 TaskDependency(
-                    task=item["task"],
+                    task=_intern(item["task"]),
                     args=item.get("args", []),
                     environment=item.get("environment"),
                 )
@@ -78,7 +84,11 @@ def normalize_task(name: str, raw: str | list[Any] | dict[str, Any]) -> Task:
     - ``"command string"``  (simple string command)
     - ``["dep1", "dep2"]`` or ``[{"task": ...}]`` (alias / dependency-only)
     - ``{cmd: ..., depends-on: ..., ...}`` (full dict definition)
+
+    Task names and dependency references are interned, so every
+    occurrence of a name shares one string object.
     """
+    name = _intern(name)
     if isinstance(raw, str):
         return Task(name=name, cmd=raw)
 
@@ -112,6 +122,34 @@ def normalize_task(name: str, raw: str | list[Any] | dict[str, Any]) -> Task:
     )
 
 
+def merge_platform_overrides(tasks: dict[str, Task], target: Any) -> None:
+    """Merge ``target.<platform>.tasks`` overrides into *tasks* in place.
+
+    Overrides for a task that has no base definition create a new task
+    from the override, so platform-only tasks are still runnable there.
+    Non-table values for *target* or a platform entry are ignored.
+    """
+    if not isinstance(target, dict):
+        return
+    for platform, platform_data in target.items():
+        if not isinstance(platform_data, dict):
+            continue
+        for name, defn in platform_data.get("tasks", {}).items():
+            override = normalize_override(
+                defn if isinstance(defn, dict) else {"cmd": defn}
+            )
+            existing = tasks.get(name)
+            if existing is not None:
+                if existing.platforms is None:
+                    existing.platforms = {}
+                existing.platforms[platform] = override
+            else:
+                task = normalize_task(name, defn)
+                task.platforms = {platform: override}
+                tasks[task.name] = task
+
+
 def normalize_tasks(raw_tasks: dict[str, Any]) -> dict[str, Task]:
     """Convert a dict of ``{name: raw_definition}`` into ``{name: Task}``."""
-    return {name: normalize_task(name, defn) for name, defn in raw_tasks.items()}
+    tasks = (normalize_task(name, defn) for name, defn in raw_tasks.items())
+    return {task.name: task for task in tasks}
@@ -4,11 +4,10 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import tomlkit
-
 from ..exceptions import TaskParseError
 from .base import TaskFileParser
-from .normalize import normalize_override, normalize_task
+from .normalize import merge_platform_overrides, normalize_tasks
+from .toml import load_toml
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -35,7 +34,7 @@ class PixiTomlParser(TaskFileParser):
     def parse(self, path: Path) -> dict[str, Task]:
         """Parse a ``pixi.toml`` file including platform overrides."""
         try:
-            data = tomlkit.loads(path.read_text(encoding="utf-8")).unwrap()
+            data = load_toml(path)
         except Exception as exc:
             raise TaskParseError(str(path), str(exc)) from exc
 
@@ -43,29 +42,9 @@ class PixiTomlParser(TaskFileParser):
         if not isinstance(raw_tasks, dict):
             raise TaskParseError(str(path), "'tasks' must be a table")
 
-        tasks: dict[str, Task] = {}
-        for name, defn in raw_tasks.items():
-            tasks[name] = normalize_task(name, defn)
-
-        target = data.get("target", {})
-        if isinstance(target, dict):
-            for platform, platform_data in target.items():
-                if not isinstance(platform_data, dict):
-                    continue
-                platform_tasks = platform_data.get("tasks", {})
-                for name, defn in platform_tasks.items():
-                    override = normalize_override(
-                        defn if isinstance(defn, dict) else {"cmd": defn}
-                    )
-                    if name in tasks:
-                        existing = tasks[name]
-                        if existing.platforms is None:
-                            existing.platforms = {}
-                        existing.platforms[platform] = override
-                    else:
-                        task = normalize_task(name, defn)
-                        task.platforms = {platform: override}
-                        tasks[name] = task
+        tasks = normalize_tasks(raw_tasks)
+
+        merge_platform_overrides(tasks, data.get("target"))
 
         return tasks
 
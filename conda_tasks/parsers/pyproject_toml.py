@@ -15,17 +15,41 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-import tomlkit
-
 from ..exceptions import TaskParseError
 from .base import TaskFileParser
-from .normalize import normalize_override, normalize_task
+from .filecache import StampedCache, file_stamp
+from .normalize import merge_platform_overrides, normalize_tasks
+from .toml import loads_toml
 
 if TYPE_CHECKING:
     from pathlib import Path
-    from typing import ClassVar
+    from typing import Any, ClassVar
 
     from ..models import Task
+    from .filecache import Stamp
+
+_PARSED: StampedCache[dict[str, Any]] = StampedCache(maxsize=4)
+
+
+def _load_pyproject(
+    path: Path,
+    stamp: Stamp | None = None,
+    raw: bytes | None = None,
+) -> dict[str, Any]:
+    """Return the TOML data in *path*, memoised on its stamp.
+
+    Detection calls ``can_handle`` and then ``parse`` on the same file;
+    this keeps that to a single read and TOML parse. *raw* may be passed
+    when the file was already read, together with the *stamp* taken
+    before reading it.
+    """
+    if stamp is None:
+        stamp = file_stamp(path)
+    data = _PARSED.get(str(path), stamp)
+    if data is None:
+        data = loads_toml(path.read_bytes() if raw is None else raw)
+        _PARSED.put(str(path), stamp, data)
+    return data
 
 
 class PyprojectTomlParser(TaskFileParser):
@@ -39,7 +63,13 @@ class PyprojectTomlParser(TaskFileParser):
         if path.name not in self.filenames:
             return False
         try:
-            data = tomlkit.loads(path.read_text(encoding="utf-8")).unwrap()
+            stamp = file_stamp(path)
+            raw = path.read_bytes()
+            # Every task table has a "tasks" key somewhere in the file, so
+            # most pyproject.toml files can be rejected without parsing.
+            if b"tasks" not in raw:
+                return False
+            data = _load_pyproject(path, stamp, raw)
         except Exception:
             return False
         tool = data.get("tool", {})
@@ -52,7 +82,7 @@ class PyprojectTomlParser(TaskFileParser):
     def parse(self, path: Path) -> dict[str, Task]:
         """Parse tasks from conda, conda-tasks, or pixi tool tables."""
         try:
-            data = tomlkit.loads(path.read_text(encoding="utf-8")).unwrap()
+            data = _load_pyproject(path)
         except Exception as exc:
             raise TaskParseError(str(path), str(exc)) from exc
 
@@ -77,28 +107,9 @@ class PyprojectTomlParser(TaskFileParser):
         if not isinstance(raw_tasks, dict):
             raise TaskParseError(str(path), "tasks must be a table")
 
-        tasks: dict[str, Task] = {}
-        for name, defn in raw_tasks.items():
-            tasks[name] = normalize_task(name, defn)
-
-        if isinstance(target_section, dict):
-            for platform, platform_data in target_section.items():
-                if not isinstance(platform_data, dict):
-                    continue
-                platform_tasks = platform_data.get("tasks", {})
-                for name, defn in platform_tasks.items():
-                    override = normalize_override(
-                        defn if isinstance(defn, dict) else {"cmd": defn}
-                    )
-                    if name in tasks:
-                        existing = tasks[name]
-                        if existing.platforms is None:
-                            existing.platforms = {}
-                        existing.platforms[platform] = override
-                    else:
-                        task = normalize_task(name, defn)
-                        task.platforms = {platform: override}
-                        tasks[name] = task
+        tasks = normalize_tasks(raw_tasks)
+
+        merge_platform_overrides(tasks, target_section)
 
         return tasks
 
@@ -14,21 +14,76 @@ Uses the same structure as pixi.toml tasks:
 
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
-import tomlkit
+if sys.version_info >= (3, 11):
+    import tomllib
 
 from ..exceptions import TaskNotFoundError, TaskParseError
 from .base import TaskFileParser
-from .normalize import normalize_override, normalize_task
+from .normalize import merge_platform_overrides, normalize_tasks
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from pathlib import Path
-    from typing import ClassVar
+    from typing import Any, ClassVar
 
     from tomlkit.items import InlineTable
 
-    from ..models import Task
+    from ..models import Task, TaskArg
+
+
+def load_toml(path: Path) -> dict[str, Any]:
+    """Read *path* as plain TOML data for the read-only parse paths.
+
+    Uses the C-accelerated stdlib ``tomllib`` on Python 3.11+; older
+    interpreters fall back to ``tomlkit``. Style-preserving round trips
+    (``add_task``/``remove_task``) keep using ``tomlkit`` directly.
+    """
+    return loads_toml(path.read_bytes())
+
+
+def loads_toml(data: bytes) -> dict[str, Any]:
+    """Parse UTF-8 encoded TOML *data* the same way as ``load_toml``."""
+    text = data.decode("utf-8")
+    if sys.version_info >= (3, 11):
+        return tomllib.loads(text)
+    import tomlkit
+
+    return tomlkit.loads(text).unwrap()
+
+
+def _args_to_list(args: list[TaskArg]) -> list[dict[str, str]]:
+    """Serialize task arguments, omitting empty defaults."""
+    return [
+        {"arg": a.name, "default": a.default} if a.default else {"arg": a.name}
+        for a in args
+    ]
+
+
+# ``(attribute, TOML key, converter)`` for task fields written when truthy,
+# in output order after ``cmd``.
+_TASK_FIELDS: tuple[tuple[str, str, Callable[[Any], Any] | None], ...] = (
+    ("depends_on", "depends-on", lambda deps: [d.task for d in deps]),
+    ("description", "description", None),
+    ("env", "env", dict),
+    ("cwd", "cwd", None),
+    ("clean_env", "clean-env", None),
+    ("args", "args", _args_to_list),
+    ("inputs", "inputs", list),
+    ("outputs", "outputs", list),
+)
+
+# Same for platform override fields, which are written when not ``None``.
+_OVERRIDE_FIELDS: tuple[tuple[str, str, Callable[[Any], Any] | None], ...] = (
+    ("cmd", "cmd", None),
+    ("env", "env", dict),
+    ("cwd", "cwd", None),
+    ("clean_env", "clean-env", None),
+    ("inputs", "inputs", list),
+    ("outputs", "outputs", list),
+)
 
 
 def _task_to_toml_inline(task: Task) -> str | InlineTable:
@@ -37,31 +92,15 @@ def _task_to_toml_inline(task: Task) -> str | InlineTable:
     Platform overrides are NOT included here -- they go into separate
     ``[target.<platform>.tasks]`` tables.
     """
+    import tomlkit
+
     defn = tomlkit.inline_table()
     if task.cmd is not None:
         defn.append("cmd", task.cmd)
-    if task.depends_on:
-        defn.append("depends-on", [d.task for d in task.depends_on])
-    if task.description:
-        defn.append("description", task.description)
-    if task.env:
-        defn.append("env", dict(task.env))
-    if task.cwd:
-        defn.append("cwd", task.cwd)
-    if task.clean_env:
-        defn.append("clean-env", True)
-    if task.args:
-        defn.append(
-            "args",
-            [
-                {"arg": a.name, "default": a.default} if a.default else {"arg": a.name}
-                for a in task.args
-            ],
-        )
-    if task.inputs:
-        defn.append("inputs", list(task.inputs))
-    if task.outputs:
-        defn.append("outputs", list(task.outputs))
+    for attr, key, convert in _TASK_FIELDS:
+        value = getattr(task, attr)
+        if value:
+            defn.append(key, convert(value) if convert else value)
 
     if len(defn) == 1 and "cmd" in defn:
         return str(defn["cmd"])
@@ -70,6 +109,8 @@ def _task_to_toml_inline(task: Task) -> str | InlineTable:
 
 def tasks_to_toml(tasks: dict[str, Task]) -> str:
     """Serialize a full task dict to ``conda.toml`` TOML string."""
+    import tomlkit
+
     doc = tomlkit.document()
 
     task_table = tomlkit.table()
@@ -83,18 +124,10 @@ def tasks_to_toml(tasks: dict[str, Task]) -> str:
             continue
         for platform, override in task.platforms.items():
             ov = tomlkit.inline_table()
-            if override.cmd is not None:
-                ov.append("cmd", override.cmd)
-            if override.env is not None:
-                ov.append("env", dict(override.env))
-            if override.cwd is not None:
-                ov.append("cwd", override.cwd)
-            if override.clean_env is not None:
-                ov.append("clean-env", override.clean_env)
-            if override.inputs is not None:
-                ov.append("inputs", list(override.inputs))
-            if override.outputs is not None:
-                ov.append("outputs", list(override.outputs))
+            for attr, key, convert in _OVERRIDE_FIELDS:
+                value = getattr(override, attr)
+                if value is not None:
+                    ov.append(key, convert(value) if convert else value)
             targets.setdefault(platform, {})[name] = (
                 str(ov["cmd"]) if len(ov) == 1 and "cmd" in ov else ov
             )
@@ -129,7 +162,7 @@ class CondaTomlParser(TaskFileParser):
     def parse(self, path: Path) -> dict[str, Task]:
         """Parse a ``conda.toml`` file including platform overrides."""
         try:
-            data = tomlkit.loads(path.read_text(encoding="utf-8")).unwrap()
+            data = load_toml(path)
         except Exception as exc:
             raise TaskParseError(str(path), str(exc)) from exc
 
@@ -137,34 +170,16 @@ class CondaTomlParser(TaskFileParser):
         if not isinstance(raw_tasks, dict):
             raise TaskParseError(str(path), "'tasks' must be a table")
 
-        tasks: dict[str, Task] = {}
-        for name, defn in raw_tasks.items():
-            tasks[name] = normalize_task(name, defn)
-
-        target = data.get("target", {})
-        if isinstance(target, dict):
-            for platform, platform_data in target.items():
-                if not isinstance(platform_data, dict):
-                    continue
-                platform_tasks = platform_data.get("tasks", {})
-                for name, defn in platform_tasks.items():
-                    override = normalize_override(
-                        defn if isinstance(defn, dict) else {"cmd": defn}
-                    )
-                    if name in tasks:
-                        existing = tasks[name]
-                        if existing.platforms is None:
-                            existing.platforms = {}
-                        existing.platforms[platform] = override
-                    else:
-                        task = normalize_task(name, defn)
-                        task.platforms = {platform: override}
-                        tasks[name] = task
+        tasks = normalize_tasks(raw_tasks)
+
+        merge_platform_overrides(tasks, data.get("target"))
 
         return tasks
 
     def add_task(self, path: Path, name: str, task: Task) -> None:
         """Add or update a task in the TOML file, creating it if needed."""
+        import tomlkit
+
         if path.exists():
             doc = tomlkit.loads(path.read_text(encoding="utf-8"))
         else:
@@ -176,6 +191,8 @@ class CondaTomlParser(TaskFileParser):
 
     def remove_task(self, path: Path, name: str) -> None:
         """Remove a task from the TOML file by name."""
+        import tomlkit
+
         doc = tomlkit.loads(path.read_text(encoding="utf-8"))
         tasks_section = doc.get("tasks", {})
         if name not in tasks_section:
@@ -3,12 +3,43 @@
 from __future__ import annotations
 
 import os
+import shlex
+import shutil
 import subprocess
 from abc import ABC, abstractmethod
-from pathlib import Path
+from typing import TYPE_CHECKING
 
 from conda.base.constants import on_win
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+_CLEAN_ENV_KEYS = (
+    "PATH",
+    "HOME",
+    "USER",
+    "LOGNAME",
+    "SHELL",
+    "TERM",
+    "LANG",
+    "SYSTEMROOT",
+    "COMSPEC",
+    "TEMP",
+    "TMP",
+)
+
+# Anything the shell would expand, redirect, chain or assign on.
+_SHELL_METACHARS = frozenset(";&|<>$`(){}[]*?#~=!%\"'\\\n")
+
+
+def _shell_exit_code(returncode: int) -> int:
+    """Report a signal-killed process as ``128 + N``, like a POSIX shell.
+
+    ``subprocess`` returns ``-N`` for a child killed by signal *N*, which only
+    happens when the command was exec'd without a shell in between.
+    """
+    return 128 - returncode if returncode < 0 else returncode
+
 
 class ShellBackend(ABC):
     """Abstract interface for executing shell commands."""
@@ -33,6 +64,19 @@ class SubprocessShell(ShellBackend):
     the command runs directly in the current shell.
     """
 
+    def __init__(self) -> None:
+        self._shell_prefix: tuple[str, ...] = (
+            ("cmd", "/d", "/c")
+            if on_win
+            else (os.environ.get("SHELL", "/bin/sh"), "-c")
+        )
+        self._clean_base: dict[str, str] = {
+            key: val
+            for key in _CLEAN_ENV_KEYS
+            if (val := os.environ.get(key)) is not None
+        }
+        self._activation_settings: tuple[str, bool, bool] | None = None
+
     def run(
         self,
         cmd: str | list[str],
@@ -44,14 +88,17 @@ class SubprocessShell(ShellBackend):
         """Execute *cmd* and return the process exit code.
 
         When *conda_prefix* is given the command runs inside an activated
-        conda environment.  Otherwise it runs directly in the current shell.
+        conda environment, unless that environment is already the active
+        one.  Otherwise it runs directly in the current shell.
         """
         run_env = self._build_env(env, clean_env)
 
         if isinstance(cmd, list):
             cmd = " ".join(cmd)
 
-        if conda_prefix is not None:
+        if conda_prefix is not None and not self._is_active_prefix(
+            conda_prefix, run_env
+        ):
             return self._run_in_env(cmd, run_env, cwd, conda_prefix)
         return self._run_direct(cmd, run_env, cwd)
 
@@ -59,36 +106,52 @@ class SubprocessShell(ShellBackend):
         """Build the environment variable mapping for a subprocess.
 
         When *clean* is True only a minimal set of system variables is
-        kept (``PATH``, ``HOME``, etc.). *extra* variables are always merged in.
+        kept (``PATH``, ``HOME``, etc.), as captured when the backend was
+        created. *extra* variables are always merged in.
         """
-        if clean:
-            base: dict[str, str] = {}
-            for key in (
-                "PATH",
-                "HOME",
-                "USER",
-                "LOGNAME",
-                "SHELL",
-                "TERM",
-                "LANG",
-                "SYSTEMROOT",
-                "COMSPEC",
-                "TEMP",
-                "TMP",
-            ):
-                val = os.environ.get(key)
-                if val is not None:
-                    base[key] = val
-        else:
-            base = dict(os.environ)
+        base = self._clean_base.copy() if clean else dict(os.environ)
         base.update(extra)
         return base
 
+    @staticmethod
+    def _is_active_prefix(conda_prefix: Path, env: dict[str, str]) -> bool:
+        """True if *env* already has *conda_prefix* activated.
+
+        Checks ``CONDA_PREFIX`` in the subprocess environment, so a clean
+        environment (which drops it) always goes through activation.
+        """
+        active = env.get("CONDA_PREFIX")
+        if not active:
+            return False
+        return os.path.realpath(active) == os.path.realpath(conda_prefix)
+
     def _run_direct(self, cmd: str, env: dict[str, str], cwd: Path) -> int:
-        """Run *cmd* in the native shell without conda activation."""
-        shell_cmd = self._shell_command(cmd)
-        result = subprocess.run(shell_cmd, env=env, cwd=str(cwd))
-        return result.returncode
+        """Run *cmd* without conda activation.
+
+        Plain commands are executed directly; anything else goes through
+        the native shell.
+        """
+        argv = self._direct_argv(cmd, env) or self._shell_command(cmd)
+        result = subprocess.run(argv, env=env, cwd=str(cwd))
+        return _shell_exit_code(result.returncode)
+
+    @staticmethod
+    def _direct_argv(cmd: str, env: dict[str, str]) -> list[str] | None:
+        """Return *cmd* split into argv if it can skip the shell, else None.
+
+        Only commands free of shell syntax whose program is found on the
+        subprocess ``PATH`` qualify, so builtins such as ``exit`` or ``cd``
+        and relative script paths still run through the shell. Always
+        None on Windows, where ``cmd.exe`` quoting rules differ.
+        """
+        if on_win or _SHELL_METACHARS.intersection(cmd):
+            return None
+        argv = shlex.split(cmd)
+        if not argv or "/" in argv[0]:
+            return None
+        if shutil.which(argv[0], path=env.get("PATH", os.defpath)) is None:
+            return None
+        return argv
 
     def _run_in_env(
         self,
@@ -102,12 +165,9 @@ class SubprocessShell(ShellBackend):
         Uses ``conda.utils.wrap_subprocess_call`` to generate an
         activation wrapper script, which is cleaned up after execution.
         """
-        from conda.base.context import context
         from conda.utils import wrap_subprocess_call
 
-        root_prefix = context.root_prefix
-        dev_mode = context.dev
-        debug_wrapper_scripts: bool = getattr(context, "debug_wrapper_scripts", False)
+        root_prefix, dev_mode, debug_wrapper_scripts = self._activation()
 
         script, command = wrap_subprocess_call(
             root_prefix,
@@ -120,15 +180,32 @@ class SubprocessShell(ShellBackend):
             result = subprocess.run(command, env=env, cwd=str(cwd))
             return result.returncode
         finally:
-            if script and Path(script).exists():
+            if script:
                 try:
-                    Path(script).unlink()
+                    os.unlink(script)
                 except OSError:
                     pass
 
-    @staticmethod
-    def _shell_command(cmd: str) -> list[str]:
-        """Wrap *cmd* in the platform-appropriate shell invocation."""
-        if on_win:
-            return ["cmd", "/d", "/c", cmd]
-        return [os.environ.get("SHELL", "/bin/sh"), "-c", cmd]
+    def _activation(self) -> tuple[str, bool, bool]:
+        """Return ``(root_prefix, dev, debug_wrapper_scripts)`` from conda's context.
+
+        Read once per backend instance; the values cannot change during
+        a single ``conda task run``.
+        """
+        if self._activation_settings is None:
+            from conda.base.context import context
+
+            self._activation_settings = (
+                context.root_prefix,
+                context.dev,
+                getattr(context, "debug_wrapper_scripts", False),
+            )
+        return self._activation_settings
+
+    def _shell_command(self, cmd: str) -> list[str]:
+        """Wrap *cmd* in the platform-appropriate shell invocation.
+
+        The shell prefix is resolved once per backend instance rather
+        than per command.
+        """
+        return [*self._shell_prefix, cmd]
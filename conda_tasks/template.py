@@ -10,6 +10,8 @@ from .context import build_template_context
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from jinja2 import Template
+
 
 @lru_cache(maxsize=1)
 def _get_jinja_env():
@@ -19,6 +21,12 @@ def _get_jinja_env():
     return Environment(undefined=StrictUndefined)
 
 
+@lru_cache(maxsize=256)
+def _compile(template_str: str) -> Template:
+    """Compile *template_str* once; the same strings recur across renders."""
+    return _get_jinja_env().from_string(template_str)
+
+
 def render(
     template_str: str,
     manifest_path: Path | None = None,
@@ -33,12 +41,10 @@ def render(
     if "{{" not in template_str and "{%" not in template_str:
         return template_str
 
-    env = _get_jinja_env()
     ctx = build_template_context(manifest_path=manifest_path, task_args=task_args)
     if extra_context:
         ctx.update(extra_context)
-    tpl = env.from_string(template_str)
-    return tpl.render(ctx)
+    return _compile(template_str).render(ctx)
 
 
 def render_list(
@@ -36,6 +36,8 @@ def test_subcommand_routing(argv, expected_subcmd):
         (["run", "test", "src/tests/"], "task_args", ["src/tests/"]),
         (["run", "build", "--skip-deps"], "skip_deps", True),
         (["run", "build", "--clean-env"], "clean_env", True),
+        (["run", "build"], "jobs", 1),
+        (["run", "build", "--jobs", "4"], "jobs", 4),
         (
             ["add", "mytask", "echo hello", "--depends-on", "build"],
             "depends_on",
@@ -51,6 +53,13 @@ def test_parser_args(argv, attr, expected):
     assert getattr(args, attr) == expected
 
 
+@pytest.mark.parametrize("value", ["0", "-3", "two"])
+def test_run_jobs_rejects_non_positive(value, capsys):
+    with pytest.raises(SystemExit):
+        generate_parser().parse_args(["run", "build", "--jobs", value])
+    assert "--jobs" in capsys.readouterr().err
+
+
 def test_execute_no_subcmd_prints_help(capsys):
     """When subcmd is None and no task_name, print help and return 0."""
     args = argparse.Namespace(subcmd=None)
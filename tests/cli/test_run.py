@@ -200,6 +200,22 @@ def test_execute_run_failure(tmp_path, monkeypatch):
         execute_run(_run_args(task_file, task_name="fail"))
 
 
+def test_execute_run_jobs(tmp_path, monkeypatch):
+    """--jobs > 1 runs every task in the graph, dependencies included."""
+    task_file = tmp_path / "conda.toml"
+    task_file.write_text(
+        '[tasks]\nlint = "ruff ."\ntest = "pytest"\n\n'
+        '[tasks.check]\ndepends-on = ["lint", "test"]\n'
+    )
+
+    fake = FakeShell()
+    monkeypatch.setattr(run_mod, "SubprocessShell", lambda: fake)
+    result = execute_run(_run_args(task_file, task_name="check", jobs=2))
+
+    assert result == 0
+    assert sorted(call[0] for call in fake.calls) == ["pytest", "ruff ."]
+
+
 def test_execute_run_verbose_with_io(tmp_path, capsys, monkeypatch):
     """Verbose mode prints inputs/outputs."""
     task_file = tmp_path / "conda.toml"
@@ -267,3 +283,21 @@ def test_execute_run_saves_cache(tmp_path, monkeypatch):
 
     assert result == 0
     assert len(save_calls) == 1
+
+
+def test_execute_run_renders_current_init_cwd(tmp_path, monkeypatch):
+    """Each run sees the working directory it was started from."""
+    task_file = tmp_path / "conda.toml"
+    task_file.write_text('[tasks]\nwhere = "echo {{ conda.init_cwd }}"\n')
+    fake = FakeShell()
+    monkeypatch.setattr(run_mod, "SubprocessShell", lambda: fake)
+
+    for name in ("one", "two"):
+        (tmp_path / name).mkdir()
+        monkeypatch.chdir(tmp_path / name)
+        execute_run(_run_args(task_file, task_name="where", quiet=True))
+
+    assert [call[0] for call in fake.calls] == [
+        f"echo {(tmp_path / 'one').resolve()}",
+        f"echo {(tmp_path / 'two').resolve()}",
+    ]
@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from conda_tasks.context import clear_template_context
 from conda_tasks.models import Task, TaskDependency, TaskOverride
 
 if TYPE_CHECKING:
@@ -17,6 +18,13 @@ pytest_plugins = (
 )
 
 
+@pytest.fixture(autouse=True)
+def _fresh_template_context():
+    """Keep ``conda.*`` template values from leaking between tests."""
+    yield
+    clear_template_context()
+
+
 @pytest.fixture
 def tmp_project(tmp_path: Path) -> Path:
     """A temporary directory acting as a project root."""
@@ -34,6 +34,64 @@ def test_can_handle_variants(tmp_project, content, expected):
     assert CondaRCParser().can_handle(path) is expected
 
 
+def test_can_handle_skips_yaml_without_task_keys(tmp_project, monkeypatch):
+    path = tmp_project / ".condarc"
+    path.write_text("channels:\n  - conda-forge\n")
+
+    def fail_loads(text):
+        raise AssertionError("YAML should not be parsed")
+
+    monkeypatch.setattr(condarc_mod, "yaml_loads", fail_loads)
+    assert not CondaRCParser().can_handle(path)
+
+
+def test_can_handle_then_parse_loads_yaml_once(sample_condarc, monkeypatch):
+    calls: list[str] = []
+
+    def recording_loads(text):
+        calls.append(text)
+        return yaml_loads(text)
+
+    monkeypatch.setattr(condarc_mod, "yaml_loads", recording_loads)
+    monkeypatch.setattr(condarc_mod, "_raw_tasks_from_condarc", lambda: {})
+    parser = CondaRCParser()
+    assert parser.can_handle(sample_condarc)
+    assert "greet" in parser.parse(sample_condarc)
+    assert len(calls) == 1
+
+    sample_condarc.write_text(
+        "plugins:\n  conda_tasks:\n    tasks:\n      solo: echo solo\n"
+    )
+    assert list(parser.parse(sample_condarc)) == ["solo"]
+    assert len(calls) == 2
+
+
+def test_edit_during_can_handle_is_not_cached(sample_condarc, monkeypatch):
+    """An edit racing the can_handle sniff is picked up by the next parse."""
+    real_read_text = type(sample_condarc).read_text
+    edited: list[bool] = []
+
+    def read_then_edit(p, *args, **kwargs):
+        text = real_read_text(p, *args, **kwargs)
+        if not edited:
+            edited.append(True)
+            p.write_text(
+                "plugins:\n  conda_tasks:\n    tasks:\n      late: echo late\n"
+            )
+        return text
+
+    monkeypatch.setattr(type(sample_condarc), "read_text", read_then_edit)
+    monkeypatch.setattr(condarc_mod, "_raw_tasks_from_condarc", lambda: {})
+    parser = CondaRCParser()
+    assert parser.can_handle(sample_condarc)
+    assert list(parser.parse(sample_condarc)) == ["late"]
+
+
+def test_can_handle_unreadable(tmp_project):
+    (tmp_project / ".condarc").mkdir()
+    assert not CondaRCParser().can_handle(tmp_project / ".condarc")
+
+
 @pytest.mark.parametrize("task_name", ["greet", "farewell"])
 def test_parse_contains_task(sample_condarc, task_name):
     tasks = CondaRCParser().parse(sample_condarc)
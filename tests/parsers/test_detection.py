@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
 from conda_tasks.exceptions import NoTaskFileError
@@ -42,6 +44,17 @@ def test_detect_priority_conda_over_pyproject(
     assert found.name == "conda.toml"
 
 
+def test_detect_walks_up_to_parent(sample_conda_toml):
+    nested = sample_conda_toml.parent / "src" / "pkg"
+    nested.mkdir(parents=True)
+    assert detect_task_file(nested) == sample_conda_toml.resolve()
+
+
+def test_detect_ignores_directory_named_like_task_file(tmp_project):
+    (tmp_project / "conda.toml").mkdir()
+    assert detect_task_file(tmp_project) is None
+
+
 def test_detect_none(tmp_project):
     assert detect_task_file(tmp_project) is None
 
@@ -58,6 +71,10 @@ def test_get_parser(fixture_name, parser_class, request):
     assert isinstance(get_parser(path), parser_class)
 
 
+def test_get_parser_reuses_instances(sample_conda_toml):
+    assert get_parser(sample_conda_toml) is get_parser(sample_conda_toml)
+
+
 def test_get_parser_unknown(tmp_project):
     path = tmp_project / "unknown.xyz"
     path.write_text("data")
@@ -70,6 +87,38 @@ def test_detect_and_parse_with_file(sample_yaml):
     assert "build" in tasks
 
 
+def test_detect_and_parse_reparses_modified_file(sample_conda_toml):
+    _, tasks = detect_and_parse(file_path=sample_conda_toml)
+    assert detect_and_parse(file_path=sample_conda_toml)[1] is tasks
+
+    sample_conda_toml.write_text('[tasks]\nfresh = "echo fresh"\n')
+    _, tasks = detect_and_parse(file_path=sample_conda_toml)
+    assert list(tasks) == ["fresh"]
+
+
+def test_detect_and_parse_relative_file_follows_cwd(tmp_path, monkeypatch):
+    for name in ("one", "two"):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "conda.toml").write_text(f'[tasks]\n{name} = "echo"\n')
+
+    monkeypatch.chdir(tmp_path / "one")
+    _, tasks = detect_and_parse(file_path=Path("conda.toml"))
+    assert list(tasks) == ["one"]
+
+    monkeypatch.chdir(tmp_path / "two")
+    path, tasks = detect_and_parse(file_path=Path("conda.toml"))
+    assert path == (tmp_path / "two" / "conda.toml").resolve()
+    assert list(tasks) == ["two"]
+
+
+def test_detect_task_file_differently_cased_name(tmp_path):
+    (tmp_path / "Conda.toml").write_text('[tasks]\nbuild = "make"\n')
+    # Found exactly when the filesystem treats conda.toml as the same file.
+    canonical = tmp_path / "conda.toml"
+    expected = canonical.resolve() if canonical.is_file() else None
+    assert detect_task_file(tmp_path) == expected
+
+
 def test_detect_and_parse_no_file(tmp_path):
     with pytest.raises(NoTaskFileError):
         detect_and_parse(start_dir=tmp_path)
@@ -0,0 +1,37 @@
+"""Tests for conda_tasks.parsers.filecache."""
+
+from __future__ import annotations
+
+import pytest
+
+from conda_tasks.parsers.filecache import StampedCache, file_stamp
+
+
+def test_file_stamp(tmp_path):
+    f = tmp_path / "conda.toml"
+    f.write_text("[tasks]\n")
+    st = f.stat()
+    assert file_stamp(f) == (st.st_mtime_ns, st.st_size)
+    with pytest.raises(OSError):
+        file_stamp(tmp_path / "missing.toml")
+
+
+def test_stamped_cache_hits_only_on_matching_stamp():
+    cache: StampedCache[str] = StampedCache(maxsize=2)
+    cache.put("a", (1, 10), "old")
+    assert cache.get("a", (1, 10)) == "old"
+    assert cache.get("a", (2, 10)) is None
+    assert cache.get("b", (1, 10)) is None
+
+
+def test_stamped_cache_evicts_oldest():
+    cache: StampedCache[str] = StampedCache(maxsize=2)
+    cache.put("a", (1, 1), "a")
+    cache.put("b", (1, 1), "b")
+    cache.put("a", (2, 1), "a2")
+    cache.put("c", (1, 1), "c")
+    assert cache.get("b", (1, 1)) is None
+    assert cache.get("a", (2, 1)) == "a2"
+    assert cache.get("c", (1, 1)) == "c"
+    cache.clear()
+    assert cache.get("c", (1, 1)) is None
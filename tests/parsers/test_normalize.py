@@ -5,10 +5,12 @@ from __future__ import annotations
 import pytest
 
 from conda_tasks.parsers.normalize import (
+    merge_platform_overrides,
     normalize_args,
     normalize_depends_on,
     normalize_override,
     normalize_task,
+    normalize_tasks,
 )
 
 
@@ -117,3 +119,38 @@ def test_normalize_task_full_dict():
     assert task.outputs == ["results/"]
     assert task.args[0].name == "path"
     assert task.args[0].default == "tests/"
+
+
+def test_merge_platform_overrides():
+    tasks = {"build": normalize_task("build", "make")}
+    target = {
+        "win-64": {"tasks": {"build": "nmake", "sign": {"cmd": "signtool"}}},
+        "linux-64": "not a table",
+    }
+    merge_platform_overrides(tasks, target)
+    assert tasks["build"].cmd == "make"
+    assert tasks["build"].platforms["win-64"].cmd == "nmake"
+    assert tasks["sign"].cmd == "signtool"
+    assert set(tasks["sign"].platforms) == {"win-64"}
+
+
+@pytest.mark.parametrize("target", [None, [], "win-64"])
+def test_merge_platform_overrides_ignores_non_tables(target):
+    tasks = {"build": normalize_task("build", "make")}
+    merge_platform_overrides(tasks, target)
+    assert tasks["build"].platforms is None
+
+
+def test_normalize_tasks_interns_names():
+    # Build the strings at runtime so they start out as distinct objects.
+    build, test = "".join(["bu", "ild"]), "".join(["te", "st"])
+    dep = "".join(["bu", "ild"])
+    tasks = normalize_tasks({build: "make", test: {"depends-on": [dep]}})
+    assert next(iter(tasks)) is tasks["build"].name
+    assert tasks["test"].depends_on[0].task is tasks["build"].name
+
+
+def test_normalize_tasks_keeps_malformed_dependency():
+    # Bad references are left for graph resolution to report.
+    tasks = normalize_tasks({"a": {"cmd": "echo", "depends-on": [{"task": 5}]}})
+    assert tasks["a"].depends_on[0].task == 5
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 import pytest
 
 from conda_tasks.models import Task
+from conda_tasks.parsers import pyproject_toml
 from conda_tasks.parsers.pyproject_toml import PyprojectTomlParser
+from conda_tasks.parsers.toml import loads_toml
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 def test_can_handle(sample_pyproject):
@@ -18,6 +25,43 @@ def test_can_handle_no_tasks(tmp_project):
     assert not PyprojectTomlParser().can_handle(path)
 
 
+def test_can_handle_then_parse_reads_and_loads_once(tmp_project, monkeypatch):
+    path = tmp_project / "pyproject.toml"
+    path.write_text('[tool.conda.tasks]\nbuild = "make"\n')
+    reads: list[Path] = []
+    loads: list[bytes] = []
+    real_read_bytes = type(path).read_bytes
+
+    def recording_read_bytes(p):
+        reads.append(p)
+        return real_read_bytes(p)
+
+    def recording_loads(data):
+        loads.append(data)
+        return loads_toml(data)
+
+    monkeypatch.setattr(type(path), "read_bytes", recording_read_bytes)
+    monkeypatch.setattr(pyproject_toml, "loads_toml", recording_loads)
+    parser = PyprojectTomlParser()
+    assert parser.can_handle(path)
+    assert list(parser.parse(path)) == ["build"]
+    assert (len(reads), len(loads)) == (1, 1)
+
+    path.write_text('[tool.conda.tasks]\nlint = "ruff check"\n')
+    assert list(parser.parse(path)) == ["lint"]
+    assert (len(reads), len(loads)) == (2, 2)
+
+
+def test_can_handle_skips_parse_without_tasks(tmp_project, monkeypatch):
+    path = tmp_project / "pyproject.toml"
+    path.write_text('[project]\nname = "example"\n')
+
+    calls: list[bytes] = []
+    monkeypatch.setattr(pyproject_toml, "loads_toml", calls.append)
+    assert not PyprojectTomlParser().can_handle(path)
+    assert calls == []
+
+
 @pytest.mark.parametrize("task_name", ["build", "test"])
 def test_parse_contains_task(sample_pyproject, task_name):
     tasks = PyprojectTomlParser().parse(sample_pyproject)
@@ -11,6 +11,8 @@ from conda_tasks.models import Task, TaskArg, TaskDependency, TaskOverride
 from conda_tasks.parsers.toml import (
     CondaTomlParser,
     _task_to_toml_inline,
+    load_toml,
+    loads_toml,
     tasks_to_toml,
 )
 
@@ -160,6 +162,18 @@ def test_parse_invalid(tmp_project):
         CondaTomlParser().parse(path)
 
 
+def test_load_toml_returns_plain_types(sample_toml):
+    data = load_toml(sample_toml)
+    assert type(data) is dict
+    assert type(data["tasks"]["build"]) is dict
+    assert type(data["tasks"]["build"]["inputs"]) is list
+    assert type(data["tasks"]["lint"]) is str
+
+
+def test_loads_toml_matches_load_toml(sample_toml):
+    assert loads_toml(sample_toml.read_bytes()) == load_toml(sample_toml)
+
+
 def test_to_toml_inline_simple_cmd():
     task = Task(name="build", cmd="make")
     assert _task_to_toml_inline(task) == "make"
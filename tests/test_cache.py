@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+import glob
+import hashlib
+import os
+from pathlib import Path
+
 import pytest
 
+from conda_tasks import cache
 from conda_tasks.cache import (
+    _cache_file,
+    _cmd_hash,
+    _env_hash,
     _expand_globs,
     _file_sha256,
     _file_stat,
+    _files_match,
     _fingerprint_files,
+    clear_fingerprint_cache,
     is_cached,
+    load_cache,
     save_cache,
 )
 
@@ -19,9 +31,10 @@ def test_file_stat(tmp_path):
     f.write_text("hello")
     stat = _file_stat(str(f))
     assert stat is not None
-    mtime, size = stat
+    mtime_ns, size = stat
     assert size == 5
-    assert mtime > 0
+    assert isinstance(mtime_ns, int)
+    assert mtime_ns > 0
 
 
 def test_file_stat_missing():
@@ -42,6 +55,16 @@ def test_file_sha256_deterministic(tmp_path):
     assert _file_sha256(str(f)) == _file_sha256(str(f))
 
 
+@pytest.mark.parametrize(
+    "size", [0, 5, 3 * 1024 * 1024 + 7], ids=["empty", "small", "large"]
+)
+def test_file_sha256_matches_hashlib(tmp_path, size):
+    data = bytes(range(256)) * (size // 256) + b"x" * (size % 256)
+    f = tmp_path / "file.bin"
+    f.write_bytes(data)
+    assert _file_sha256(str(f)) == hashlib.sha256(data).hexdigest()
+
+
 @pytest.mark.parametrize(
     ("pattern", "setup", "expected_count"),
     [
@@ -67,10 +90,56 @@ def test_expand_globs(tmp_path, pattern, setup, expected_count):
     assert len(result) == expected_count
 
 
+def test_expand_globs_dedupes_overlapping_patterns(tmp_path):
+    for name in ("b.py", "a.py", "sub/c.py"):
+        p = tmp_path / name
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("")
+    result = _expand_globs(["*.py", "**/*.py", "a.py"], tmp_path)
+    assert result == [
+        str(tmp_path / "a.py"),
+        str(tmp_path / "b.py"),
+        str(tmp_path / "sub" / "c.py"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "*",
+        "**",
+        "**/*.py",
+        "sub/**",
+        "*/*.py",
+        ".*",
+        "**/.hidden.py",
+        "s?b/[cd]*.py",
+        "dist/",
+        "main.py",
+        "missing/**",
+    ],
+)
+def test_expand_globs_matches_glob(tmp_path, pattern):
+    for name in (
+        "main.py",
+        "notes.txt",
+        ".hidden.py",
+        "sub/c.py",
+        "sub/deep/d.py",
+        ".git/config",
+        "dist/app.whl",
+    ):
+        p = tmp_path / name
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("")
+    expected = sorted(set(glob.glob(str(tmp_path / pattern), recursive=True)))
+    assert _expand_globs([pattern], tmp_path) == expected
+
+
 @pytest.mark.parametrize(
     ("paths", "expected_keys"),
     [
-        (["file.txt"], {"mtime", "size", "sha256"}),
+        (["file.txt"], {"mtime_ns", "size", "sha256"}),
     ],
 )
 def test_fingerprint_files(tmp_path, paths, expected_keys):
@@ -87,6 +156,95 @@ def test_fingerprint_missing_file():
     assert len(fp) == 0
 
 
+def test_fingerprint_many_files(tmp_path):
+    paths = []
+    for i in range(20):
+        f = tmp_path / f"file{i}.txt"
+        f.write_text(f"content {i}")
+        paths.append(str(f))
+    paths.insert(5, str(tmp_path / "missing.txt"))
+    fp = _fingerprint_files(paths)
+    assert list(fp) == [p for p in paths if not p.endswith("missing.txt")]
+    for p, entry in fp.items():
+        assert entry["sha256"] == _file_sha256(p)
+
+
+@pytest.mark.parametrize(
+    ("env", "expected"),
+    [
+        ({}, "{}"),
+        ({"B": "2", "A": "1"}, '{"A": "1", "B": "2"}'),
+    ],
+)
+def test_env_hash_matches_sorted_json(env, expected):
+    assert _env_hash(env) == hashlib.sha256(expected.encode()).hexdigest()
+    assert _env_hash(dict(reversed(env.items()))) == _env_hash(env)
+
+
+def test_cmd_hash():
+    assert _cmd_hash("make") == hashlib.sha256(b"make").hexdigest()
+    assert _cmd_hash("make") != _cmd_hash("make all")
+
+
+_FP_A = {"mtime_ns": 1_000, "size": 3, "sha256": "aaa"}
+_FP_B = {"mtime_ns": 2_000, "size": 3, "sha256": "bbb"}
+
+
+@pytest.mark.parametrize(
+    ("cached", "current", "expected"),
+    [
+        ({}, {}, True),
+        ({"a": _FP_A}, {"a": _FP_A}, True),
+        ({"a": _FP_A}, {"a": {**_FP_A, "mtime_ns": 5_000}}, True),
+        ({"a": {"mtime": 1e-6, "size": 3, "sha256": "aaa"}}, {"a": _FP_A}, True),
+        ({"a": {"mtime": 1e-6, "size": 3, "sha256": "bbb"}}, {"a": _FP_A}, False),
+        ({"a": _FP_A}, {"a": _FP_B}, False),
+        ({"a": _FP_A}, {"b": _FP_A}, False),
+        ({"a": _FP_A}, {"a": _FP_A, "b": _FP_B}, False),
+        ({"a": _FP_A, "b": _FP_B}, {"a": _FP_A}, False),
+    ],
+    ids=[
+        "empty",
+        "identical",
+        "touched-same-content",
+        "legacy-mtime-same-content",
+        "legacy-mtime-content-changed",
+        "content-changed",
+        "renamed",
+        "added",
+        "removed",
+    ],
+)
+def test_files_match(cached, current, expected):
+    assert _files_match(cached, current) is expected
+
+
+def test_cache_dir_created_on_save_only(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "_cache_root", lambda: tmp_path / "cache-root")
+    project = tmp_path / "project"
+    project.mkdir()
+    args = (project, "build", "make", {}, [], [], project)
+
+    assert load_cache(project, "build") is None
+    assert not is_cached(*args)
+    assert not (tmp_path / "cache-root").exists()
+
+    save_cache(*args)
+    assert _cache_file(project, "build").is_file()
+    assert _cache_file(project, "build").parent.parent == tmp_path / "cache-root"
+
+
+def test_project_key_relative_root_follows_cwd(tmp_path, monkeypatch):
+    for name in ("one", "two"):
+        (tmp_path / name).mkdir()
+
+    monkeypatch.chdir(tmp_path / "one")
+    first = cache._project_key(Path("."))
+    monkeypatch.chdir(tmp_path / "two")
+    assert cache._project_key(Path(".")) != first
+    assert cache._project_key(Path(".")) == cache._project_key(tmp_path / "two")
+
+
 def test_not_cached_initially(tmp_path):
     assert not is_cached(
         tmp_path,
@@ -126,6 +284,24 @@ def test_save_and_check(tmp_path):
     )
 
 
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlinks")
+def test_save_and_check_with_dangling_symlink_output(tmp_path):
+    """Unstat-able glob matches are left out of both sides of the check."""
+    src = tmp_path / "main.py"
+    src.write_text("print('hello')")
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    (dist / "app.whl").write_text("fake wheel")
+    try:
+        (dist / "stale.whl").symlink_to(tmp_path / "missing.whl")
+    except OSError:
+        pytest.skip("symlinks not permitted")
+
+    args = (tmp_path, "build", "make", {}, ["main.py"], ["dist/*.whl"], tmp_path)
+    save_cache(*args)
+    assert is_cached(*args)
+
+
 @pytest.mark.parametrize(
     ("save_cmd", "save_env", "check_cmd", "check_env", "mutate"),
     [
@@ -182,3 +358,138 @@ def test_cache_invalidation(
         outputs,
         tmp_path,
     )
+
+
+def test_unchanged_files_are_not_rehashed(tmp_path, monkeypatch):
+    src = tmp_path / "main.py"
+    src.write_text("v1")
+    args = (tmp_path, "build", "make", {}, ["main.py"], [], tmp_path)
+    save_cache(*args)
+
+    hashed: list[str] = []
+    real_digest = cache._digest_for_stat
+
+    def recording_digest(path, mtime_ns, size):
+        hashed.append(path)
+        return real_digest(path, mtime_ns, size)
+
+    monkeypatch.setattr(cache, "_digest_for_stat", recording_digest)
+    assert is_cached(*args)
+    save_cache(*args)
+    assert hashed == []
+
+    src.write_text("v2-longer")
+    assert not is_cached(*args)
+    assert hashed == [str(src)]
+
+
+def test_fingerprint_stats_each_file_once(tmp_path, monkeypatch):
+    paths = []
+    for i in range(3):
+        f = tmp_path / f"f{i}.txt"
+        f.write_text(str(i))
+        paths.append(str(f))
+    clear_fingerprint_cache()
+
+    stats: list[str] = []
+    real_stat = os.stat
+
+    def recording_stat(path, *args, **kwargs):
+        stats.append(path)
+        return real_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(cache.os, "stat", recording_stat)
+    fp = cache._fingerprint_files(paths)
+    assert sorted(stats) == paths
+    assert [fp[p]["sha256"] for p in paths] == [
+        hashlib.sha256(str(i).encode()).hexdigest() for i in range(3)
+    ]
+
+
+def test_file_sha256_memoized(tmp_path, monkeypatch):
+    f = tmp_path / "file.txt"
+    f.write_text("hello")
+    clear_fingerprint_cache()
+
+    calls: list[str] = []
+    real_digest = cache._sha256_digest
+
+    def recording_digest(path):
+        calls.append(path)
+        return real_digest(path)
+
+    monkeypatch.setattr(cache, "_sha256_digest", recording_digest)
+    first = _file_sha256(str(f))
+    assert _file_sha256(str(f)) == first
+    assert len(calls) == 1
+
+    f.write_text("hello, world")
+    assert _file_sha256(str(f)) != first
+    assert len(calls) == 2
+
+    clear_fingerprint_cache()
+    _file_sha256(str(f))
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize(
+    "content",
+    [b"{not json", b"\xff\xfe", b"[]"],
+    ids=["malformed", "not-utf8", "not-a-mapping"],
+)
+def test_corrupt_cache_entry_is_a_miss(tmp_path, content):
+    args = (tmp_path, "build", "make", {}, [], [], tmp_path)
+    save_cache(*args)
+    _cache_file(tmp_path, "build").write_bytes(content)
+    assert not is_cached(*args)
+
+
+def test_load_cache_round_trip(tmp_path):
+    src = tmp_path / "main.py"
+    src.write_text("v1")
+    args = (tmp_path, "build", "make", {}, ["main.py"], [], tmp_path)
+    assert load_cache(tmp_path, "build") is None
+
+    save_cache(*args)
+    entry = load_cache(tmp_path, "build")
+    assert entry is not None
+    assert list(entry["inputs"]) == [str(src)]
+    assert is_cached(*args, entry=entry)
+
+
+def test_save_cache_skips_unchanged_entry(tmp_path):
+    (tmp_path / "main.py").write_text("v1")
+    args = (tmp_path, "build", "make", {}, ["main.py"], [], tmp_path)
+    save_cache(*args)
+    cf = _cache_file(tmp_path, "build")
+    os.utime(cf, ns=(0, 0))
+
+    save_cache(*args, entry=load_cache(tmp_path, "build"))
+    assert cf.stat().st_mtime_ns == 0
+
+    save_cache(tmp_path, "build", "make all", {}, ["main.py"], [], tmp_path)
+    assert cf.stat().st_mtime_ns != 0
+
+
+def test_save_cache_leaves_no_temp_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "_cache_root", lambda: tmp_path / "cache-root")
+    args = (tmp_path, "build", "make", {}, [], [], tmp_path)
+    save_cache(*args)
+    cf = _cache_file(tmp_path, "build")
+    assert [p.name for p in cf.parent.iterdir()] == ["build.json"]
+
+
+def test_save_cache_failed_write_keeps_previous_entry(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "_cache_root", lambda: tmp_path / "cache-root")
+    save_cache(tmp_path, "build", "make", {}, [], [], tmp_path)
+    cf = _cache_file(tmp_path, "build")
+    before = cf.read_bytes()
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cache.os, "replace", failing_replace)
+    with pytest.raises(OSError, match="disk full"):
+        save_cache(tmp_path, "build", "make all", {}, [], [], tmp_path)
+    assert cf.read_bytes() == before
+    assert [p.name for p in cf.parent.iterdir()] == ["build.json"]
@@ -9,7 +9,11 @@ import pytest
 from conda import __version__ as conda_version
 from conda.base.context import Context, context
 
-from conda_tasks.context import CondaContext, build_template_context
+from conda_tasks.context import (
+    CondaContext,
+    build_template_context,
+    clear_template_context,
+)
 
 
 def test_platform():
@@ -89,6 +93,14 @@ def test_init_cwd():
     assert CondaContext().init_cwd == os.getcwd()
 
 
+def test_init_cwd_is_fixed_on_first_access(tmp_path, monkeypatch):
+    ctx = CondaContext()
+    first = ctx.init_cwd
+    monkeypatch.chdir(tmp_path)
+    assert ctx.init_cwd == first
+    assert CondaContext().init_cwd == os.getcwd()
+
+
 def test_build_context_has_conda_and_pixi():
     ctx = build_template_context()
     assert "conda" in ctx
@@ -96,6 +108,25 @@ def test_build_context_has_conda_and_pixi():
     assert ctx["conda"] is ctx["pixi"]
 
 
+def test_build_context_reuses_namespace_per_manifest(tmp_path):
+    manifest = tmp_path / "conda.toml"
+    first = build_template_context(manifest_path=manifest)
+    second = build_template_context(manifest_path=manifest, task_args={"x": "1"})
+    assert first is not second
+    assert first["conda"] is second["conda"]
+    assert build_template_context()["conda"] is not first["conda"]
+
+
+def test_clear_template_context_picks_up_new_cwd(tmp_path, monkeypatch):
+    first = build_template_context()["conda"]
+    assert first.init_cwd == os.getcwd()
+    monkeypatch.chdir(tmp_path)
+    clear_template_context()
+    ctx = build_template_context()["conda"]
+    assert ctx is not first
+    assert ctx.init_cwd == os.getcwd()
+
+
 def test_build_context_task_args():
     ctx = build_template_context(task_args={"path": "tests/"})
     assert ctx["path"] == "tests/"
@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import threading
+
 import pytest
 
-from conda_tasks.exceptions import CyclicDependencyError, TaskNotFoundError
-from conda_tasks.graph import resolve_execution_order
+from conda_tasks.exceptions import (
+    CyclicDependencyError,
+    TaskExecutionError,
+    TaskNotFoundError,
+)
+from conda_tasks.graph import resolve_execution_order, run_concurrently
 from conda_tasks.models import Task, TaskDependency
 
 
@@ -159,3 +165,65 @@ def test_alias_in_order():
     order = resolve_execution_order("check", tasks)
     assert order[-1] == "check"
     assert set(order) == {"test", "lint", "check"}
+
+
+def _diamond() -> dict[str, Task]:
+    return {
+        "a": Task(name="a", cmd="a"),
+        "b": Task(name="b", cmd="b", depends_on=[TaskDependency(task="a")]),
+        "c": Task(name="c", cmd="c", depends_on=[TaskDependency(task="a")]),
+        "d": Task(
+            name="d",
+            cmd="d",
+            depends_on=[TaskDependency(task="b"), TaskDependency(task="c")],
+        ),
+    }
+
+
+def test_run_concurrently_overlaps_independent_tasks():
+    tasks = _diamond()
+    # b and c each wait for the other; this only passes if they overlap.
+    barrier = threading.Barrier(2, timeout=5)
+    started: list[str] = []
+
+    def run_task(name):
+        started.append(name)
+        if name in ("b", "c"):
+            barrier.wait()
+
+    run_concurrently(resolve_execution_order("d", tasks), tasks, run_task, jobs=2)
+    assert started[0] == "a"
+    assert started[-1] == "d"
+    assert set(started) == {"a", "b", "c", "d"}
+
+
+def test_run_concurrently_stops_after_failure():
+    tasks = _diamond()
+    started: list[str] = []
+
+    def run_task(name):
+        started.append(name)
+        if name == "b":
+            raise TaskExecutionError(name, 1)
+
+    with pytest.raises(TaskExecutionError, match="b"):
+        run_concurrently(resolve_execution_order("d", tasks), tasks, run_task, jobs=2)
+    assert "d" not in started
+
+
+def test_run_concurrently_starts_critical_path_first():
+    tasks = {
+        "a_short": Task(name="a_short", cmd="a"),
+        "z1": Task(name="z1", cmd="z1"),
+        "z2": Task(name="z2", cmd="z2", depends_on=[TaskDependency(task="z1")]),
+        "target": Task(
+            name="target",
+            cmd="t",
+            depends_on=[TaskDependency(task="a_short"), TaskDependency(task="z2")],
+        ),
+    }
+    order = resolve_execution_order("target", tasks)
+    assert order[0] == "a_short"
+    started: list[str] = []
+    run_concurrently(order, tasks, started.append, jobs=1)
+    assert started == ["z1", "a_short", "z2", "target"]
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from dataclasses import fields
+
 import pytest
 
+from conda_tasks import models
 from conda_tasks.exceptions import TaskNotFoundError
 from conda_tasks.models import Task, TaskArg, TaskDependency, TaskOverride
 
@@ -49,6 +52,23 @@ def test_task_is_hidden(name, expected_hidden):
     assert task.is_hidden is expected_hidden
 
 
+def test_task_is_hidden_follows_renames():
+    task = Task(name="build", cmd="make")
+    task.name = "_build"
+    assert task.is_hidden
+
+
+def test_task_is_hidden_survives_platform_resolution():
+    task = Task(
+        name="_setup",
+        cmd="mkdir build",
+        platforms={"win-64": TaskOverride(cmd="md build")},
+    )
+    resolved = task.resolve_for_platform("win-64")
+    assert resolved.is_hidden
+    assert resolved == Task(name="_setup", cmd="md build", platforms=task.platforms)
+
+
 def test_task_simple_command():
     task = Task(name="build", cmd="make")
     assert task.cmd == "make"
@@ -111,6 +131,32 @@ def test_resolve_platform_override(
     assert resolved.env == expected_env
 
 
+@pytest.mark.parametrize(
+    "instance",
+    [
+        TaskArg(name="path"),
+        TaskDependency(task="build"),
+        TaskOverride(),
+        Task(name="build"),
+    ],
+    ids=lambda obj: type(obj).__name__,
+)
+def test_models_are_slotted(instance):
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.unexpected = True
+
+
+def test_resolve_field_lists_cover_models():
+    task_fields = {f.name for f in fields(Task) if f.init}
+    override_fields = {f.name for f in fields(TaskOverride)}
+    overridable = set(models._OVERRIDABLE_FIELDS)
+    passthrough = set(models._PASSTHROUGH_FIELDS)
+    assert overridable | passthrough == task_fields
+    assert not overridable & passthrough
+    assert overridable == override_fields
+
+
 @pytest.mark.parametrize(
     ("available", "expected_in", "expected_not_in"),
     [
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import os
+
 import pytest
 from conda.base.constants import on_win
 
+from conda_tasks import runner
 from conda_tasks.runner import SubprocessShell
 
 
@@ -83,6 +86,14 @@ def test_build_env(extra_env, clean, expected_key, expected_val):
             assert key in allowed
 
 
+def test_build_env_clean_returns_fresh_dict():
+    shell = SubprocessShell()
+    first = shell._build_env({"FOO": "bar"}, clean=True)
+    second = shell._build_env({}, clean=True)
+    assert "FOO" in first
+    assert "FOO" not in second
+
+
 def test_list_command(tmp_path):
     shell = SubprocessShell()
     exit_code = shell.run(["echo", "hello"], {}, tmp_path)
@@ -91,14 +102,89 @@ def test_list_command(tmp_path):
 
 @pytest.mark.skipif(on_win, reason="Unix-only test")
 def test_shell_command_unix():
-    result = SubprocessShell._shell_command("echo hi")
+    result = SubprocessShell()._shell_command("echo hi")
     assert result[-1] == "echo hi"
     assert "-c" in result
 
 
+@pytest.mark.skipif(on_win, reason="Unix-only test")
+def test_shell_command_uses_shell_at_construction(monkeypatch):
+    monkeypatch.setenv("SHELL", "/bin/zsh")
+    shell = SubprocessShell()
+    monkeypatch.setenv("SHELL", "/bin/bash")
+    assert shell._shell_command("echo hi") == ["/bin/zsh", "-c", "echo hi"]
+
+
+@pytest.mark.skipif(on_win, reason="Unix-only test")
+@pytest.mark.parametrize(
+    ("cmd", "expected"),
+    [
+        ("python -m pytest -q", ["python", "-m", "pytest", "-q"]),
+        ("echo $HOME", None),
+        ("make build && make test", None),
+        ("FOO=1 python app.py", None),
+        ('echo "quoted"', None),
+        ("exit 1", None),
+        ("./build.sh", None),
+        ("", None),
+    ],
+    ids=[
+        "plain",
+        "expansion",
+        "chain",
+        "assignment",
+        "quotes",
+        "builtin",
+        "relative",
+        "empty",
+    ],
+)
+def test_direct_argv(cmd, expected):
+    env = {"PATH": os.environ["PATH"]}
+    assert SubprocessShell._direct_argv(cmd, env) == expected
+
+
+@pytest.mark.skipif(on_win, reason="Unix-only test")
+def test_run_direct_skips_shell_for_plain_command(tmp_path, monkeypatch):
+    import subprocess as subprocess_mod
+    import types
+
+    calls: list[list[str]] = []
+
+    def fake_run(argv, **kwargs):
+        calls.append(argv)
+        return types.SimpleNamespace(returncode=0)
+
+    monkeypatch.setattr(subprocess_mod, "run", fake_run)
+    shell = SubprocessShell()
+    shell.run("python -V", {}, tmp_path)
+    shell.run("python -V > out.txt", {}, tmp_path)
+    assert calls[0] == ["python", "-V"]
+    assert calls[1] == [*shell._shell_prefix, "python -V > out.txt"]
+
+
+def test_run_direct_reports_signals_like_a_shell(tmp_path, monkeypatch):
+    """A directly exec'd command killed by SIGINT fails with 128 + 2."""
+    import subprocess as subprocess_mod
+    import types
+
+    monkeypatch.setattr(
+        subprocess_mod, "run", lambda argv, **kw: types.SimpleNamespace(returncode=-2)
+    )
+    assert SubprocessShell().run("python -V", {}, tmp_path) == 130
+
+
+@pytest.mark.parametrize(
+    ("returncode", "expected"),
+    [(0, 0), (1, 1), (-2, 130), (-9, 137)],
+)
+def test_shell_exit_code(returncode, expected):
+    assert runner._shell_exit_code(returncode) == expected
+
+
 @pytest.mark.skipif(not on_win, reason="Windows-only test")
 def test_shell_command_windows():
-    result = SubprocessShell._shell_command("echo hi")
+    result = SubprocessShell()._shell_command("echo hi")
     assert result[0] == "cmd"
     assert "/c" in result
 
@@ -140,6 +226,37 @@ def test_run_in_env(tmp_path, monkeypatch):
     assert len(wrap_calls) == 1
 
 
+def test_run_in_env_reads_context_once(tmp_path, monkeypatch):
+    """Activation settings are read from conda's context on first use only."""
+    import subprocess as subprocess_mod
+    import types
+
+    import conda.base.context
+    import conda.utils
+
+    fake_context = types.SimpleNamespace(root_prefix=str(tmp_path / "root"), dev=False)
+    wrap_calls: list[tuple] = []
+
+    def fake_wrap(*args):
+        wrap_calls.append(args)
+        return (None, ["echo", "hi"])
+
+    monkeypatch.setattr(conda.base.context, "context", fake_context)
+    monkeypatch.setattr(conda.utils, "wrap_subprocess_call", fake_wrap)
+    monkeypatch.setattr(
+        subprocess_mod,
+        "run",
+        lambda *a, **kw: types.SimpleNamespace(returncode=0),
+    )
+
+    shell = SubprocessShell()
+    shell._run_in_env("echo one", {}, tmp_path, tmp_path / "env")
+    fake_context.root_prefix = str(tmp_path / "other")
+    shell._run_in_env("echo two", {}, tmp_path, tmp_path / "env")
+
+    assert [call[0] for call in wrap_calls] == [str(tmp_path / "root")] * 2
+
+
 def test_run_in_env_cleans_up_script(tmp_path, monkeypatch):
     """_run_in_env removes the wrapper script after execution."""
     import subprocess as subprocess_mod
@@ -188,3 +305,25 @@ def test_run_delegates_to_env_when_prefix_given(tmp_path, monkeypatch):
 
     assert code == 0
     assert len(called_with) == 1
+
+
+@pytest.mark.parametrize(
+    ("clean_env", "wrapped"),
+    [(False, False), (True, True)],
+    ids=["inherited-env", "clean-env"],
+)
+def test_run_skips_activation_for_active_prefix(
+    tmp_path, monkeypatch, clean_env, wrapped
+):
+    """An already-active prefix only needs activating when the env is clean."""
+    monkeypatch.setenv("CONDA_PREFIX", str(tmp_path))
+    calls: list[str] = []
+    shell = SubprocessShell()
+    monkeypatch.setattr(
+        shell, "_run_in_env", lambda cmd, *args: calls.append("env") or 0
+    )
+    monkeypatch.setattr(
+        shell, "_run_direct", lambda cmd, *args: calls.append("direct") or 0
+    )
+    shell.run("echo hi", {}, tmp_path, conda_prefix=tmp_path, clean_env=clean_env)
+    assert calls == ["env" if wrapped else "direct"]
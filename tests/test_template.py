@@ -6,6 +6,7 @@ import pytest
 from conda.base.constants import on_win
 from conda.base.context import context
 
+from conda_tasks import template
 from conda_tasks.template import render, render_list
 
 
@@ -62,3 +63,19 @@ def test_render_extra_context():
 )
 def test_render_list(items, task_args, expected):
     assert render_list(items, task_args=task_args) == expected
+
+
+def test_render_compiles_each_template_once(monkeypatch):
+    template._compile.cache_clear()
+    calls: list[str] = []
+    env = template._get_jinja_env()
+    real_from_string = env.from_string
+
+    def recording_from_string(source, *args, **kwargs):
+        calls.append(source)
+        return real_from_string(source, *args, **kwargs)
+
+    monkeypatch.setattr(env, "from_string", recording_from_string)
+    assert render("run {{ x }}", task_args={"x": "a"}) == "run a"
+    assert render("run {{ x }}", task_args={"x": "b"}) == "run b"
+    assert calls == ["run {{ x }}"]